@@ -10,26 +10,45 @@ Usage:
 """
 
 import argparse
+import asyncio
+import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 from dateutil import parser as date_parser
 from dotenv import load_dotenv
 
-from src.twitter_api import TwitterAPI, TwitterAPIError, extract_username_from_url
+from src.twitter_api import (
+    PROFILE_URL_RE,
+    TwitterAPI,
+    TwitterAPIError,
+    extract_username_from_url,
+)
 from src.extractor import (
     parse_api_tweet,
     filter_tweets_by_date,
+    filter_sorted_tweets_by_date,
     group_tweets_into_threads,
     get_tweets_needing_video_download,
 )
 from src.downloader import VideoDownloader
+from src.models import Tweet, Thread
+from src.rate_limit import AsyncRateLimiter
 
 
 # Default output directory
 DEFAULT_OUTPUT_DIR = Path(__file__).parent / "data"
 
+# Default number of videos downloaded in parallel
+DEFAULT_CONCURRENCY = 5
+
+# Default maximum video download starts per second
+DEFAULT_RPS = 1.0
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -95,16 +114,61 @@ Setup:
         help="Only save tweets that have videos",
     )
     
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="Maximum number of API pages (up to 100 tweets each) to fetch (default: no limit)",
+    )
+    
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch tweets newer than the newest one already saved in the output directory",
+    )
+    
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of videos to download in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=DEFAULT_RPS,
+        help=f"Maximum video downloads started per second, 0 to disable (default: {DEFAULT_RPS})",
+    )
+    
+    parser.add_argument(
+        "--no-skip",
+        action="store_true",
+        help="Re-download and re-save tweets even if their files already exist",
+    )
+    
     return parser.parse_args()
 
 
 def validate_args(args: argparse.Namespace) -> bool:
     """Validate command line arguments."""
     # Validate URL format
-    if not ("x.com/" in args.url or "twitter.com/" in args.url):
+    if not PROFILE_URL_RE.match(args.url.strip()):
         print("Error: URL must be a Twitter/X profile URL (e.g., https://x.com/username)")
         return False
     
+    if args.concurrency < 1:
+        print("Error: --concurrency must be at least 1")
+        return False
+    
+    if args.max_pages is not None and args.max_pages < 1:
+        print("Error: --max-pages must be at least 1")
+        return False
+    
+    if args.rps < 0:
+        print("Error: --rps cannot be negative")
+        return False
+    
     return True
 
 
@@ -113,6 +177,164 @@ def parse_date(date_str: str) -> datetime:
     return date_parser.parse(date_str).replace(hour=0, minute=0, second=0, microsecond=0)
 
 
+# Saved tweet/thread JSON filename: {YYYY}_{MM}_{DD}_{id}_[thread_]twitt.json
+SAVED_JSON_RE = re.compile(r"^(?P<date>\d{4}_\d{2}_\d{2})_(?P<id>\d+)_(?:thread_)?twitt\.json$")
+
+
+def find_latest_saved_tweet_id(
+    output_dir: Path,
+    username: str,
+    start_date: datetime,
+    end_date: datetime,
+) -> str | None:
+    """
+    Find the newest tweet ID fully saved for a user within the date range.
+    
+    Candidates are taken from filenames (newest ID first) and their JSON is
+    opened to confirm the author. An item whose video is missing (its JSON is
+    written even when the download fails) must be fetched again, so the
+    returned ID is the newest complete item older than every incomplete one.
+    Unreadable or malformed JSON files are skipped.
+    
+    Returns:
+        The newest saved tweet ID, or None if nothing has been saved yet
+    """
+    if not output_dir.is_dir():
+        return None
+    
+    start_key = start_date.strftime("%Y_%m_%d")
+    end_key = end_date.strftime("%Y_%m_%d")
+    existing = set()
+    candidates = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            existing.add(entry.name)
+            match = SAVED_JSON_RE.match(entry.name)
+            if match and start_key <= match.group("date") <= end_key:
+                prefix = f"{match.group('date')}_{match.group('id')}"
+                candidates.append((int(match.group("id")), entry.path, prefix))
+    
+    latest = None
+    for _, path, prefix in sorted(candidates, reverse=True):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        try:
+            if str(data.get("author", "")).lower() != username.lower():
+                continue
+            tweets = data.get("tweets", [])
+            has_video = data.get("video_url") or any(t.get("video_url") for t in tweets)
+            if has_video and prefix + "_video.mp4" not in existing:
+                # Everything from here up must be fetched again
+                latest = None
+                continue
+            # A thread's later tweets are newer than its first tweet
+            ids = [int(data["id"])] + [int(t["id"]) for t in tweets]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+        if latest is None:
+            latest = max(ids)
+    
+    return str(latest) if latest is not None else None
+
+
+def list_existing_files(output_dir: Path) -> set[str]:
+    """List the file names in the output directory with a single scan."""
+    with os.scandir(output_dir) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def is_tweet_saved(tweet: Tweet, existing: set[str]) -> bool:
+    """Check if a tweet's JSON (and video, if it has one) are already saved."""
+    if tweet.get_tweet_filename() not in existing:
+        return False
+    return not tweet.video_url or tweet.get_video_filename() in existing
+
+
+def is_thread_saved(thread: Thread, existing: set[str]) -> bool:
+    """Check if a thread's JSON (and video, if it has one) are already saved."""
+    if thread.get_thread_filename() not in existing:
+        return False
+    return not thread.has_video() or thread.get_video_filename() in existing
+
+
+async def process_items(
+    downloader: VideoDownloader,
+    tweets: list[Tweet],
+    threads: list[Thread],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rps: float | None = DEFAULT_RPS,
+) -> list[tuple[bool, bool, str | None]]:
+    """
+    Download videos and save JSON for tweets and threads concurrently.
+    
+    Items without video are written up front in a single JSON batch. Blocking
+    yt-dlp downloads run in a shared thread pool; a semaphore caps how many
+    are in flight at once, and download starts are paced to `rps` per second
+    (None disables pacing), to avoid 429s from X's video CDN.
+    
+    Returns:
+        List of (had_video, video_success, json_path) tuples, one per item
+    """
+    video_tweets = [t for t in tweets if t.video_url]
+    video_threads = [t for t in threads if t.has_video()]
+    
+    # Save JSON for items without video in one batch
+    json_only_tweets = [t for t in tweets if not t.video_url]
+    json_only_threads = [t for t in threads if not t.has_video()]
+    json_paths = downloader.save_json_batch(json_only_tweets, json_only_threads)
+    for json_path in json_paths:
+        print(f"  [OK] JSON: {json_path}")
+    results: list[tuple[bool, bool, str | None]] = [
+        (False, False, json_path) for json_path in json_paths
+    ]
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AsyncRateLimiter(rps) if rps else None
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        
+        async def process_tweet(i: int, tweet: Tweet) -> tuple[bool, bool, str | None]:
+            async with semaphore:
+                if limiter:
+                    await limiter.wait()
+                success, video_path, json_path = await downloader.process_tweet_async(tweet, executor)
+            
+            lines = [f"Processing tweet {i}/{len(video_tweets)}: {tweet.id}"]
+            if success:
+                lines.append(f"  [OK] Video: {video_path}")
+            else:
+                lines.append(f"  [FAIL] Video download failed")
+            if json_path:
+                lines.append(f"  [OK] JSON: {json_path}")
+            print("\n".join(lines))
+            return True, success, json_path
+        
+        async def process_thread(i: int, thread: Thread) -> tuple[bool, bool, str | None]:
+            async with semaphore:
+                if limiter:
+                    await limiter.wait()
+                success, video_path, json_path = await downloader.process_thread_async(thread, executor)
+            
+            lines = [f"Processing thread {i}/{len(video_threads)}: {thread.id} ({len(thread.tweets)} tweets)"]
+            if success:
+                lines.append(f"  [OK] Video: {video_path}")
+            else:
+                lines.append(f"  [FAIL] Video download failed")
+            if json_path:
+                lines.append(f"  [OK] JSON: {json_path}")
+            print("\n".join(lines))
+            return True, success, json_path
+        
+        tasks = [process_tweet(i, t) for i, t in enumerate(video_tweets, 1)]
+        tasks += [process_thread(i, t) for i, t in enumerate(video_threads, 1)]
+        results += await asyncio.gather(*tasks)
+    
+    return results
+
+
 def run_scraper(
     url: str,
     start_date: datetime,
@@ -120,6 +342,11 @@ def run_scraper(
     output_dir: Path,
     limit: int | None = None,
     videos_only: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    skip_existing: bool = True,
+    rps: float | None = DEFAULT_RPS,
+    incremental: bool = False,
+    max_pages: int | None = None,
 ) -> None:
     """Run the main scraping process."""
     # Extract username from URL
@@ -134,6 +361,9 @@ def run_scraper(
     print(f"Output directory: {output_dir}")
     if limit:
         print(f"Tweet limit: {limit}")
+    print(f"Concurrent downloads: {concurrency}")
+    if rps:
+        print(f"Download rate limit: {rps} per second")
     print("-" * 50)
     
     # Initialize API client
@@ -158,43 +388,61 @@ def run_scraper(
     start_date_tz = start_date.replace(tzinfo=timezone.utc)
     end_date_tz = end_date.replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
     
-    raw_tweets = []
+    # Only fetch tweets newer than the last saved one
+    since_id = None
+    if incremental:
+        since_id = find_latest_saved_tweet_id(output_dir, username, start_date, end_date)
+        if since_id:
+            print(f"Incremental mode: fetching tweets newer than {since_id}")
+    
+    # Parse each tweet as it arrives so only Tweet objects are kept in
+    # memory, never the full list of raw API dicts
+    fetched_count = 0
+    tweets = []
+    undated_tweets = []  # dated "now" by parse_api_tweet, so out of API order
     try:
         for tweet_data in api.get_user_tweets(
             username=username,
             start_date=start_date_tz,
             end_date=end_date_tz,
             limit=limit,
+            since_id=since_id,
+            max_pages=max_pages,
         ):
-            raw_tweets.append(tweet_data)
+            fetched_count += 1
             
             # Progress indicator
-            if len(raw_tweets) % 10 == 0:
-                print(f"  Fetched {len(raw_tweets)} tweets...")
+            if fetched_count % 10 == 0:
+                print(f"  Fetched {fetched_count} tweets...")
+            
+            # Skip retweets before paying for a parse
+            if tweet_data.get("isRetweet"):
+                continue
+            
+            tweet = parse_api_tweet(tweet_data)
+            if tweet:
+                (tweets if tweet_data.get("datetime") else undated_tweets).append(tweet)
     
     except TwitterAPIError as e:
         print(f"\nError fetching tweets: {e}")
         return
     
-    print(f"\nFetched {len(raw_tweets)} tweets from API")
+    print(f"\nFetched {fetched_count} tweets from API")
     
-    if not raw_tweets:
+    if not fetched_count:
         print("No tweets found in the specified date range.")
         return
     
-    # Parse tweet data
-    tweets = []
-    for data in raw_tweets:
-        tweet = parse_api_tweet(data)
-        if tweet:
-            # Skip retweets
-            if not tweet.is_retweet:
-                tweets.append(tweet)
-    
-    print(f"Parsed {len(tweets)} original tweets (excluding retweets)")
+    print(f"Parsed {len(tweets) + len(undated_tweets)} original tweets (excluding retweets)")
     
     # Filter by date range (API should already do this, but double-check)
-    tweets = filter_tweets_by_date(tweets, start_date, end_date)
+    # The timeline API returns tweets newest first, so a binary search suffices
+    # for dated tweets; the few undated ones (dated now) are checked directly
+    # and stay at the newest end
+    tweets = (
+        filter_tweets_by_date(undated_tweets, start_date, end_date)
+        + filter_sorted_tweets_by_date(tweets, start_date, end_date, newest_first=True)
+    )
     print(f"Tweets in date range: {len(tweets)}")
     
     # Group into threads
@@ -218,6 +466,19 @@ def run_scraper(
         tweets_to_process = standalone_tweets
         threads_to_process = threads
     
+    # Skip items saved by a previous run (one directory scan, no per-file stat)
+    if skip_existing:
+        existing = list_existing_files(output_dir)
+        pending_tweets = [t for t in tweets_to_process if not is_tweet_saved(t, existing)]
+        pending_threads = [t for t in threads_to_process if not is_thread_saved(t, existing)]
+        skipped = (
+            len(tweets_to_process) - len(pending_tweets)
+            + len(threads_to_process) - len(pending_threads)
+        )
+        if skipped:
+            print(f"Skipping {skipped} item(s) already saved in {output_dir}")
+        tweets_to_process, threads_to_process = pending_tweets, pending_threads
+    
     if not tweets_to_process and not threads_to_process:
         print("\nNo tweets to process.")
         return
@@ -227,51 +488,16 @@ def run_scraper(
     print("Downloading videos and saving data...")
     print("=" * 50 + "\n")
     
-    video_success_count = 0
-    video_fail_count = 0
-    json_count = 0
-    
-    # Process standalone tweets
-    for i, tweet in enumerate(tweets_to_process, 1):
-        print(f"Processing tweet {i}/{len(tweets_to_process)}: {tweet.id}")
-        
-        # Download video if present
-        if tweet.video_url:
-            success, video_path, json_path = downloader.process_tweet(tweet)
-            if success:
-                print(f"  [OK] Video: {video_path}")
-                video_success_count += 1
-            else:
-                print(f"  [FAIL] Video download failed")
-                video_fail_count += 1
-        else:
-            # Just save JSON
-            json_path = downloader.save_tweet_json(tweet)
-        
-        if json_path:
-            print(f"  [OK] JSON: {json_path}")
-            json_count += 1
+    try:
+        results = asyncio.run(
+            process_items(downloader, tweets_to_process, threads_to_process, concurrency, rps)
+        )
+    finally:
+        downloader.close()
     
-    # Process threads
-    for i, thread in enumerate(threads_to_process, 1):
-        print(f"Processing thread {i}/{len(threads_to_process)}: {thread.id} ({len(thread.tweets)} tweets)")
-        
-        # Download video if present
-        if thread.has_video():
-            success, video_path, json_path = downloader.process_thread(thread)
-            if success:
-                print(f"  [OK] Video: {video_path}")
-                video_success_count += 1
-            else:
-                print(f"  [FAIL] Video download failed")
-                video_fail_count += 1
-        else:
-            # Just save JSON
-            json_path = downloader.save_thread_json(thread)
-        
-        if json_path:
-            print(f"  [OK] JSON: {json_path}")
-            json_count += 1
+    video_success_count = sum(1 for had_video, success, _ in results if had_video and success)
+    video_fail_count = sum(1 for had_video, success, _ in results if had_video and not success)
+    json_count = sum(1 for _, _, json_path in results if json_path)
     
     # Summary
     print("\n" + "=" * 50)
@@ -305,6 +531,11 @@ def main() -> None:
         output_dir=output_dir,
         limit=args.limit,
         videos_only=args.videos_only,
+        concurrency=args.concurrency,
+        skip_existing=not args.no_skip,
+        rps=args.rps or None,
+        incremental=args.incremental,
+        max_pages=args.max_pages,
     )
 
 
@@ -1,18 +1,26 @@
 """Video downloader using yt-dlp for Twitter videos."""
 
+import asyncio
+import copy
 import os
-import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Optional
 
 import yt_dlp
 
+from . import jsonio
 from .models import Tweet, Thread
 
 
 class VideoDownloader:
     """Downloads videos from Twitter using yt-dlp."""
     
+    # Maximum number of extracted info dicts kept in memory
+    INFO_CACHE_SIZE = 256
+    
     def __init__(self, output_dir: Path):
         """
         Initialize the video downloader.
@@ -22,6 +30,19 @@ class VideoDownloader:
         """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # One YoutubeDL per worker thread: built once and reused for every
+        # download on that thread (outtmpl is swapped per video, which is
+        # not safe to share across threads).
+        self._local = threading.local()
+        self._ydl_instances: list[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
+        
+        # LRU of tweet URL -> raw (unprocessed) yt-dlp info dict, so a URL
+        # queried again (e.g. by download_thread_video) reuses the extraction
+        # instead of re-hitting X's API; each download processes a fresh copy
+        self._info_cache: OrderedDict[str, dict] = OrderedDict()
+        self._info_lock = threading.Lock()
     
     def _get_yt_dlp_options(self, output_path: str) -> dict:
         """Get yt-dlp options for downloading."""
@@ -31,6 +52,8 @@ class VideoDownloader:
             'quiet': True,
             'no_warnings': True,
             'extract_flat': False,
+            'concurrent_fragment_downloads': 4,
+            'retries': 3,
             'http_headers': {
                 'User-Agent': (
                     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
@@ -40,6 +63,28 @@ class VideoDownloader:
             },
         }
     
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get the YoutubeDL instance for the current thread, creating it on first use."""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            options = self._get_yt_dlp_options(str(self.output_dir / '%(id)s.%(ext)s'))
+            # Persist extractor state (e.g. X's guest token) across
+            # downloads and runs instead of re-fetching it per video
+            options['cachedir'] = str(self.output_dir / '.ytcache')
+            ydl = yt_dlp.YoutubeDL(options)
+            self._local.ydl = ydl
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+    
+    def close(self) -> None:
+        """Close all YoutubeDL instances created by this downloader."""
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+        for ydl in instances:
+            ydl.close()
+        self._local = threading.local()
+    
     def download_video(self, tweet_url: str, output_filename: str) -> Optional[str]:
         """
         Download a video from a tweet URL.
@@ -56,37 +101,63 @@ class VideoDownloader:
         # Remove extension for yt-dlp template (it adds its own)
         output_template = str(output_path.with_suffix(''))
         
-        options = self._get_yt_dlp_options(output_template + '.%(ext)s')
+        ydl = self._get_ydl()
+        ydl.params['outtmpl'] = {'default': output_template + '.%(ext)s'}
         
         try:
-            with yt_dlp.YoutubeDL(options) as ydl:
-                # Extract info first to check if video exists
-                info = ydl.extract_info(tweet_url, download=False)
-                
-                if not info:
-                    print(f"No video found at {tweet_url}")
-                    return None
-                
-                # Download the video
-                ydl.download([tweet_url])
-                
-                # Find the downloaded file (extension might vary)
-                for ext in ['mp4', 'mkv', 'webm', 'mov']:
-                    potential_file = output_path.with_suffix(f'.{ext}')
-                    if potential_file.exists():
-                        # Rename to mp4 if different
-                        if ext != 'mp4':
-                            final_path = output_path.with_suffix('.mp4')
-                            potential_file.rename(final_path)
-                            return str(final_path)
-                        return str(potential_file)
-                
-                print(f"Downloaded file not found for {tweet_url}")
-                return None
-                
+            raw_info = self._get_cached_info(tweet_url)
+            if raw_info is None:
+                # Extraction only; a missing video surfaces as DownloadError
+                raw_info = ydl.extract_info(tweet_url, download=False, process=False)
+                if raw_info:
+                    self._cache_info(tweet_url, raw_info)
+            
+            # Processing fills in download state (requested_downloads,
+            # filepath), so never hand it a dict a previous download touched
+            info = ydl.process_ie_result(copy.deepcopy(raw_info), download=True) if raw_info else None
+        except yt_dlp.utils.DownloadError as e:
+            print(f"No video found at {tweet_url}: {e}")
+            return None
         except Exception as e:
             print(f"Error downloading video from {tweet_url}: {e}")
             return None
+        
+        if not info:
+            print(f"No video found at {tweet_url}")
+            return None
+        
+        # yt-dlp reports the final path (after any merge/remux); fall back
+        # to the template-expanded name for older versions
+        requested = info.get('requested_downloads')
+        if requested and requested[0].get('filepath'):
+            downloaded = Path(requested[0]['filepath'])
+        else:
+            downloaded = Path(ydl.prepare_filename(info))
+        
+        # Rename to mp4 if different
+        if downloaded.suffix != '.mp4':
+            try:
+                downloaded = downloaded.rename(output_path.with_suffix('.mp4'))
+            except FileNotFoundError:
+                print(f"Downloaded file not found for {tweet_url}")
+                return None
+        return str(downloaded)
+    
+    def _get_cached_info(self, tweet_url: str) -> Optional[dict]:
+        """Get a previously extracted raw info dict for a URL, if cached (do not modify it)."""
+        with self._info_lock:
+            info = self._info_cache.get(tweet_url)
+            if info is not None:
+                self._info_cache.move_to_end(tweet_url)
+            return info
+    
+    def _cache_info(self, tweet_url: str, info: dict) -> None:
+        """Store a raw extracted info dict, evicting the least recently used."""
+        with self._info_lock:
+            self._info_cache[tweet_url] = info
+            self._info_cache.move_to_end(tweet_url)
+            while len(self._info_cache) > self.INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
     
     def download_tweet_video(self, tweet: Tweet) -> bool:
         """
@@ -143,8 +214,7 @@ class VideoDownloader:
         """
         output_path = self.output_dir / tweet.get_tweet_filename()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(tweet.to_dict(), f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(jsonio.dumps(tweet.to_dict()))
         
         return str(output_path)
     
@@ -160,11 +230,57 @@ class VideoDownloader:
         """
         output_path = self.output_dir / thread.get_thread_filename()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(thread.to_dict(), f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(jsonio.dumps(thread.to_dict()))
         
         return str(output_path)
     
+    def flush_json_batch(self, items: list[tuple[Path, bytes]]) -> list[str]:
+        """
+        Write pre-serialized JSON payloads, one unbuffered write per file.
+        
+        Each file still gets its own os.open/os.write/os.close; this only
+        skips building a buffered file object per file.
+        
+        Args:
+            items: List of (output_path, payload) pairs
+            
+        Returns:
+            List of paths written, in input order
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        written_paths = []
+        for path, payload in items:
+            fd = os.open(path, flags, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            written_paths.append(str(path))
+        return written_paths
+    
+    def save_json_batch(self, tweets: list[Tweet], threads: list[Thread]) -> list[str]:
+        """
+        Serialize many tweets and threads up front, then write each to its file.
+        
+        Args:
+            tweets: Tweet objects to save
+            threads: Thread objects to save
+            
+        Returns:
+            List of saved JSON paths (tweets first, then threads)
+        """
+        items = [
+            (self.output_dir / t.get_tweet_filename(), jsonio.dumps(t.to_dict()))
+            for t in tweets
+        ]
+        items += [
+            (self.output_dir / t.get_thread_filename(), jsonio.dumps(t.to_dict()))
+            for t in threads
+        ]
+        return self.flush_json_batch(items)
+    
     def process_tweet(self, tweet: Tweet) -> tuple[bool, Optional[str], Optional[str]]:
         """
         Process a tweet: download video and save JSON.
@@ -209,6 +325,42 @@ class VideoDownloader:
         json_path = self.save_thread_json(thread)
         
         return video_path is not None, video_path, json_path
+    
+    async def process_tweet_async(
+        self,
+        tweet: Tweet,
+        executor: Optional[Executor] = None,
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run process_tweet in a worker thread so downloads can overlap.
+        
+        Args:
+            tweet: Tweet object to process
+            executor: Executor to run the blocking download in (default: loop's executor)
+            
+        Returns:
+            Tuple of (success, video_path, json_path)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.process_tweet, tweet)
+    
+    async def process_thread_async(
+        self,
+        thread: Thread,
+        executor: Optional[Executor] = None,
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run process_thread in a worker thread so downloads can overlap.
+        
+        Args:
+            thread: Thread object to process
+            executor: Executor to run the blocking download in (default: loop's executor)
+            
+        Returns:
+            Tuple of (success, video_path, json_path)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.process_thread, thread)
 
 
 def create_downloader(output_dir: Path) -> VideoDownloader:
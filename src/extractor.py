@@ -1,12 +1,23 @@
 """Tweet parsing and thread grouping from API responses."""
 
-from datetime import datetime
-from typing import Optional
-from dateutil import parser as date_parser
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
 
 from .models import Tweet, Thread
 
 
+# The API returns ISO-8601 timestamps, so the generic dateutil parser is not needed
+_parse_iso = datetime.fromisoformat
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' on Python < 3.11."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return _parse_iso(value)
+
+
 def parse_api_tweet(data: dict) -> Optional[Tweet]:
     """
     Parse API tweet data into a Tweet object.
@@ -19,11 +30,8 @@ def parse_api_tweet(data: dict) -> Optional[Tweet]:
     """
     try:
         # Parse datetime
-        date = None
-        if data.get("datetime"):
-            date = date_parser.parse(data["datetime"])
-        else:
-            date = datetime.now()
+        raw_date = data.get("datetime")
+        date = parse_iso_datetime(raw_date) if raw_date else datetime.now(timezone.utc)
         
         return Tweet(
             id=data["id"],
@@ -41,8 +49,48 @@ def parse_api_tweet(data: dict) -> Optional[Tweet]:
         return None
 
 
+def _utc_timestamp(date: datetime) -> float:
+    """Get a POSIX timestamp for a date, treating naive dates as UTC."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
+
+def _tweet_timestamp(tweet: Tweet) -> float:
+    """Get a tweet's cached POSIX timestamp."""
+    return tweet._ts
+
+
+def _negated_tweet_timestamp(tweet: Tweet) -> float:
+    """Sort key that orders newest-first tweets ascending, for bisect."""
+    return -tweet._ts
+
+
+def iter_tweets_by_date(
+    tweets: Iterable[Tweet],
+    start_date: datetime,
+    end_date: datetime,
+) -> Iterator[Tweet]:
+    """
+    Lazily yield tweets within the date range.
+    
+    Args:
+        tweets: Iterable of Tweet objects (e.g. a stream being parsed)
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        
+    Yields:
+        Tweets whose date falls within the range
+    """
+    start_ts = _utc_timestamp(start_date)
+    end_ts = _utc_timestamp(end_date)
+    for t in tweets:
+        if start_ts <= t._ts <= end_ts:
+            yield t
+
+
 def filter_tweets_by_date(
-    tweets: list[Tweet],
+    tweets: Iterable[Tweet],
     start_date: datetime,
     end_date: datetime,
 ) -> list[Tweet]:
@@ -50,19 +98,49 @@ def filter_tweets_by_date(
     Filter tweets to only include those within the date range.
     
     Args:
-        tweets: List of Tweet objects
+        tweets: Iterable of Tweet objects
         start_date: Start of date range (inclusive)
         end_date: End of date range (inclusive)
         
     Returns:
         Filtered list of tweets
     """
-    filtered = []
-    for t in tweets:
-        tweet_date = t.date.replace(tzinfo=None) if t.date.tzinfo else t.date
-        if start_date <= tweet_date <= end_date:
-            filtered.append(t)
-    return filtered
+    return list(iter_tweets_by_date(tweets, start_date, end_date))
+
+
+def filter_sorted_tweets_by_date(
+    tweets: list[Tweet],
+    start_date: datetime,
+    end_date: datetime,
+    newest_first: bool = False,
+) -> list[Tweet]:
+    """
+    Filter date-sorted tweets to the date range with two binary searches.
+    
+    Only O(log N) date comparisons are made, instead of one per tweet. The
+    input must already be sorted by date; use filter_tweets_by_date otherwise.
+    Tweets without a real date break that order (parse_api_tweet dates them
+    now), so keep them out of `tweets` and filter them separately.
+    
+    Args:
+        tweets: List of Tweet objects sorted by date
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        newest_first: True if tweets are in reverse-chronological order
+            (as returned by the user timeline API)
+        
+    Returns:
+        Filtered list of tweets, in the input order
+    """
+    start, end = _utc_timestamp(start_date), _utc_timestamp(end_date)
+    if newest_first:
+        # Negated timestamps ascend in a newest-first list
+        lo = bisect_left(tweets, -end, key=_negated_tweet_timestamp)
+        hi = bisect_right(tweets, -start, key=_negated_tweet_timestamp)
+    else:
+        lo = bisect_left(tweets, start, key=_tweet_timestamp)
+        hi = bisect_right(tweets, end, key=_tweet_timestamp)
+    return tweets[lo:hi]
 
 
 def filter_tweets_with_video(tweets: list[Tweet]) -> list[Tweet]:
@@ -89,8 +167,8 @@ def group_tweets_into_threads(
     # Index tweets by ID for quick lookup
     tweet_by_id = {t.id: t for t in tweets}
     
-    # Track which tweets are part of threads
-    in_thread = set()
+    # Map each tweet already placed in a thread to that thread
+    tweet_to_thread: dict[str, Thread] = {}
     threads = []
     
     # Find thread starters (tweets that are replied to by the same author)
@@ -99,7 +177,8 @@ def group_tweets_into_threads(
             parent = tweet_by_id.get(tweet.reply_to_id)
             if parent and parent.author == tweet.author == target_author:
                 # This is a thread continuation
-                if parent.id not in in_thread:
+                thread = tweet_to_thread.get(parent.id)
+                if thread is None:
                     # Start a new thread
                     thread = Thread(
                         id=parent.id,
@@ -108,24 +187,22 @@ def group_tweets_into_threads(
                         tweets=[parent],
                     )
                     threads.append(thread)
-                    in_thread.add(parent.id)
+                    tweet_to_thread[parent.id] = thread
                 
                 # Add this tweet to the thread
-                for thread in threads:
-                    if thread.id == parent.id or parent.id in [t.id for t in thread.tweets]:
-                        if tweet.id not in in_thread:
-                            thread.tweets.append(tweet)
-                            in_thread.add(tweet.id)
-                        break
+                if tweet.id not in tweet_to_thread:
+                    thread.tweets.append(tweet)
+                    tweet_to_thread[tweet.id] = thread
     
     # Sort tweets within each thread by date
     for thread in threads:
         thread.tweets.sort(key=lambda t: t.date)
         # Set video URL from first tweet with video
         thread.video_url = thread.get_first_video_url()
+        thread._has_video = thread.video_url is not None
     
     # Get standalone tweets (not part of any thread)
-    standalone = [t for t in tweets if t.id not in in_thread]
+    standalone = [t for t in tweets if t.id not in tweet_to_thread]
     
     return standalone, threads
 
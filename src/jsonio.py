@@ -0,0 +1,51 @@
+"""JSON serialization helpers, using orjson when it is installed."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, compact: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    
+    Pretty-printed with a 2-space indent unless `compact`, which skips all
+    whitespace (noticeably faster and smaller for large documents).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_atomic(data: Any, path: Path) -> None:
+    """
+    Write data as JSON to path atomically.
+    
+    The JSON goes to a sibling .tmp file that then replaces path, so a crash
+    mid-write never leaves a truncated file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
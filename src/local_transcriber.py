@@ -0,0 +1,179 @@
+"""Local transcription with faster-whisper, as an alternative to the OpenAI API."""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+from .transcriber import OpenAITranscriber, StrPath, Transcription, TranscriptionSegment
+
+try:
+    import faster_whisper
+except ImportError:  # faster-whisper is optional; only needed for --local
+    faster_whisper = None
+
+
+class LocalTranscriber(OpenAITranscriber):
+    """
+    Transcribe Farsi/Persian audio locally with faster-whisper (CTranslate2).
+    
+    A drop-in replacement for OpenAITranscriber: cleanup, caching, VAD and
+    silence detection work the same, only the transcription itself runs on
+    a local model instead of the API. The model is loaded once and shared
+    by every call; up to `num_workers` calls run on it at once (CTranslate2
+    keeps one model replica per worker), each batched internally by
+    faster-whisper's BatchedInferencePipeline.
+    """
+    
+    DEFAULT_LOCAL_MODEL = "large-v3"
+    
+    # No upload, so no size limit and no reason to compress
+    MAX_FILE_SIZE = float("inf")
+    DEFAULT_UPLOAD_FORMAT = "wav"
+    
+    def __init__(
+        self,
+        language: str = "fa",
+        *,
+        model: Optional[str] = None,
+        device: str = "auto",
+        compute_type: str = "int8",
+        batch_size: int = 8,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        **kwargs,
+    ):
+        """
+        Initialize the local transcriber and load the model.
+        
+        Args:
+            language: Language code for transcription (default: 'fa' for Farsi)
+            model: faster-whisper model name or path (default: large-v3)
+            device: Device for inference: auto, cuda or cpu
+            compute_type: CTranslate2 quantization, e.g. int8, int8_float16, float16
+            batch_size: Audio windows decoded together per batch
+            cpu_threads: CPU threads used on the CPU (0 = CTranslate2 default)
+            num_workers: Files transcribed in parallel on the one loaded model
+            **kwargs: Passed to OpenAITranscriber (prompt, temperature,
+                clean_audio, trim_silence, cache_dir, use_cache, use_vad, ...)
+        """
+        self.device = device
+        self.compute_type = compute_type
+        self.batch_size = batch_size
+        self.cpu_threads = cpu_threads
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        self.num_workers = num_workers
+        
+        super().__init__(language=language, model=model or self.DEFAULT_LOCAL_MODEL, **kwargs)
+        
+        whisper_model = faster_whisper.WhisperModel(
+            self.model,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+        )
+        self._pipeline = faster_whisper.BatchedInferencePipeline(model=whisper_model)
+        self._model_slots = threading.BoundedSemaphore(self.num_workers)
+    
+    def _connect(self, api_key: Optional[str]) -> None:
+        """No API client; just make sure faster-whisper is available."""
+        if faster_whisper is None:
+            raise RuntimeError(
+                "faster-whisper is not installed. Install it with: pip install faster-whisper"
+            )
+        self.api_key = None
+        self.client = None
+    
+    def transcribe(
+        self,
+        audio_path: StrPath,
+        return_timestamps: bool = True,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+        prepared: bool = False,
+        force_clean: bool = False,
+    ) -> Transcription:
+        """
+        Transcribe an audio file with the local model.
+        
+        Takes the same arguments as OpenAITranscriber.transcribe. `model` is
+        ignored (the model is loaded once, at construction) and so is
+        `force_clean`: short clips already in upload shape are never cleaned.
+        
+        Returns:
+            Transcription object with text and optional segments
+        """
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        work_dir = None
+        time_scale = 1.0 if prepared else self.speed
+        try:
+            if not prepared:
+                work_dir = tempfile.mkdtemp(prefix="transcribe_")
+                audio_path = self.prepare_upload(
+                    audio_path,
+                    work_dir,
+                    clean_audio=clean_audio,
+                    trim_silence=trim_silence,
+                )
+            
+            transcription = self._run_model(audio_path, return_timestamps, prompt, temperature)
+        finally:
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        
+        return self._rescaled(transcription, time_scale)
+    
+    def _transcribe_bytes(
+        self,
+        audio_bytes: bytes,
+        upload_name: str,
+        return_timestamps: bool,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> Transcription:
+        """Decode in-memory audio with the local model (`model` is ignored)."""
+        return self._run_model(io.BytesIO(audio_bytes), return_timestamps, prompt, temperature)
+    
+    def _run_model(
+        self,
+        audio,
+        return_timestamps: bool,
+        prompt: Optional[str],
+        temperature: Optional[float],
+    ) -> Transcription:
+        """Transcribe a path or binary file object on the shared model."""
+        selected_prompt = prompt if prompt is not None else self.prompt
+        selected_temperature = temperature if temperature is not None else self.temperature
+        
+        options: dict = {"language": self.language, "batch_size": self.batch_size}
+        if selected_prompt:
+            options["initial_prompt"] = selected_prompt
+        if selected_temperature is not None:
+            options["temperature"] = selected_temperature
+        
+        with self._model_slots:
+            segments, _ = self._pipeline.transcribe(audio, **options)
+            # Decoding happens lazily, while the segments are iterated
+            segments = [
+                TranscriptionSegment(start=seg.start, end=seg.end, text=seg.text.strip())
+                for seg in segments
+            ]
+        
+        return Transcription(
+            text=" ".join(seg.text for seg in segments if seg.text),
+            language=self.language,
+            segments=segments if return_timestamps else [],
+        )
@@ -1,12 +1,12 @@
 """Data models for Twitter scraper and transcriber."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 import json
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """A segment of transcribed audio with timestamps."""
     
@@ -32,7 +32,7 @@ class TranscriptionSegment:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transcription:
     """Complete transcription result."""
     
@@ -59,7 +59,7 @@ class Transcription:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tweet:
     """Represents a single tweet."""
     
@@ -74,6 +74,16 @@ class Tweet:
     is_reply: bool = False
     reply_to_id: Optional[str] = None
     transcript: Optional[Transcription] = None
+    _prefix: str = field(init=False, repr=False, compare=False)
+    # POSIX timestamp of `date` (naive dates are taken as UTC), for cheap range checks
+    _ts: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Filename prefix is derived from immutable identity fields; cache
+        # it so each get_*_filename call doesn't re-run strftime
+        self._prefix = f"{self.date:%Y_%m_%d}_{self.id}"
+        date = self.date if self.date.tzinfo else self.date.replace(tzinfo=timezone.utc)
+        self._ts = date.timestamp()
     
     def to_dict(self) -> dict:
         """Convert tweet to dictionary for JSON serialization."""
@@ -95,27 +105,26 @@ class Tweet:
     
     def get_filename_prefix(self) -> str:
         """Get the filename prefix based on date and ID."""
-        date_str = self.date.strftime("%Y_%m_%d")
-        return f"{date_str}_{self.id}"
+        return self._prefix
     
     def get_video_filename(self) -> str:
         """Get the video filename."""
-        return f"{self.get_filename_prefix()}_video.mp4"
+        return self._prefix + "_video.mp4"
     
     def get_tweet_filename(self) -> str:
         """Get the tweet JSON filename."""
-        return f"{self.get_filename_prefix()}_twitt.json"
+        return self._prefix + "_twitt.json"
     
     def get_subtitle_filename(self) -> str:
         """Get the subtitle/transcript JSON filename."""
-        return f"{self.get_filename_prefix()}_subtitle.json"
+        return self._prefix + "_subtitle.json"
     
     def get_voice_filename(self) -> str:
         """Get the extracted audio filename."""
-        return f"{self.get_filename_prefix()}_voice.wav"
+        return self._prefix + "_voice.wav"
 
 
-@dataclass
+@dataclass(slots=True)
 class Thread:
     """Represents a thread of tweets from the same author."""
     
@@ -126,6 +135,14 @@ class Thread:
     video_url: Optional[str] = None
     video_file: Optional[str] = None
     transcript: Optional[Transcription] = None
+    _prefix: str = field(init=False, repr=False, compare=False)
+    # Cached result of has_video(); None until computed or set by the grouper
+    _has_video: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Filename prefix is derived from immutable identity fields; cache
+        # it so each get_*_filename call doesn't re-run strftime
+        self._prefix = f"{self.date:%Y_%m_%d}_{self.id}"
     
     def to_dict(self) -> dict:
         """Convert thread to dictionary for JSON serialization."""
@@ -143,28 +160,29 @@ class Thread:
     
     def get_filename_prefix(self) -> str:
         """Get the filename prefix based on date and ID."""
-        date_str = self.date.strftime("%Y_%m_%d")
-        return f"{date_str}_{self.id}"
+        return self._prefix
     
     def get_video_filename(self) -> str:
         """Get the video filename."""
-        return f"{self.get_filename_prefix()}_video.mp4"
+        return self._prefix + "_video.mp4"
     
     def get_thread_filename(self) -> str:
         """Get the thread JSON filename."""
-        return f"{self.get_filename_prefix()}_thread_twitt.json"
+        return self._prefix + "_thread_twitt.json"
     
     def get_subtitle_filename(self) -> str:
         """Get the subtitle/transcript JSON filename."""
-        return f"{self.get_filename_prefix()}_subtitle.json"
+        return self._prefix + "_subtitle.json"
     
     def get_voice_filename(self) -> str:
         """Get the extracted audio filename."""
-        return f"{self.get_filename_prefix()}_voice.wav"
+        return self._prefix + "_voice.wav"
     
     def has_video(self) -> bool:
         """Check if any tweet in the thread has a video."""
-        return self.video_url is not None or any(t.video_url for t in self.tweets)
+        if self._has_video is None:
+            self._has_video = self.video_url is not None or any(t.video_url for t in self.tweets)
+        return self._has_video
     
     def get_first_video_url(self) -> Optional[str]:
         """Get the first video URL from the thread."""
@@ -176,7 +194,7 @@ class Thread:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Results from a scraping session."""
     
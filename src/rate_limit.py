@@ -0,0 +1,123 @@
+"""Request pacing helpers."""
+
+import asyncio
+import threading
+import time
+
+
+class AsyncRateLimiter:
+    """Space out request starts to at most `rps` per second (asyncio)."""
+    
+    def __init__(self, rps: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rps: Maximum request starts per second (must be > 0)
+        """
+        if rps <= 0:
+            raise ValueError(f"rps must be positive, got {rps}")
+        self._interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self._interval
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Space out request starts to at most `rps` per second (thread-safe)."""
+    
+    def __init__(self, rps: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rps: Maximum request starts per second (must be > 0)
+        """
+        if rps <= 0:
+            raise ValueError(f"rps must be positive, got {rps}")
+        self._interval = 1.0 / rps
+        self._next = 0.0
+        self._slow_factor = 1.0
+        self._slow_until = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block until the next request is allowed to start."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            interval = self._interval * (self._slow_factor if now < self._slow_until else 1.0)
+            self._next = max(now, self._next) + interval
+        if delay:
+            time.sleep(delay)
+    
+    def slow_down(self, factor: float = 2.0, duration: float = 60.0, pause: float = 0.0) -> None:
+        """
+        Temporarily lower the rate, e.g. after the server answered 429.
+        
+        Args:
+            factor: Request spacing is multiplied by this for `duration` seconds
+            duration: Seconds the lower rate lasts
+            pause: Seconds to hold off every request from now (e.g. Retry-After)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._slow_factor = factor
+            self._slow_until = now + duration
+            self._next = max(self._next, now + pause)
+
+
+class RateLimitPacer:
+    """
+    Pace requests per endpoint from X API x-rate-limit-* response headers.
+    
+    Requests are spaced at least `min_interval` apart; once an endpoint
+    reports no remaining requests, the next one waits for the window reset
+    instead of running into a 429.
+    """
+    
+    def __init__(self, min_interval: float = 1.0):
+        """
+        Initialize the pacer.
+        
+        Args:
+            min_interval: Minimum seconds between requests to one endpoint
+        """
+        if min_interval < 0:
+            raise ValueError(f"min_interval must not be negative, got {min_interval}")
+        self.min_interval = min_interval
+        self._next: dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, endpoint: str, headers) -> None:
+        """
+        Record a response from `endpoint`.
+        
+        Args:
+            endpoint: Endpoint key the response belongs to
+            headers: Response headers (case-insensitive mapping)
+        """
+        next_at = time.time() + self.min_interval
+        try:
+            if int(headers["x-rate-limit-remaining"]) == 0:
+                next_at = max(next_at, float(headers["x-rate-limit-reset"]))
+        except (KeyError, ValueError):
+            pass
+        with self._lock:
+            self._next[endpoint] = next_at
+    
+    def wait(self, endpoint: str) -> None:
+        """Block until the next request to `endpoint` is allowed."""
+        with self._lock:
+            next_at = self._next.get(endpoint, 0.0)
+        delay = next_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
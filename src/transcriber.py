@@ -1,17 +1,91 @@
 """Audio extraction and Farsi speech-to-text transcription module."""
 
+import asyncio
+import bisect
+import csv
+import functools
+import hashlib
+import importlib.util
+import json
+import mimetypes
 import os
+import queue
+import random
+import re
+import shutil
+import sqlite3
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
-from openai import OpenAI
+from .rate_limit import RateLimiter
+from .transcript_cache import TranscriptCache
+from .vad import VADFilter
 
+# openai and httpx are imported where they're used, so audio extraction
+# (and the CLI's --help) never pays for loading the network stack
 
-@dataclass
+# httpx's optional HTTP/2 support; without h2, connections stay on HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Anything accepted as a filesystem path
+StrPath = str | os.PathLike
+
+# Absolute paths to the FFmpeg binaries, resolved once (None if not installed)
+_FFMPEG = shutil.which("ffmpeg")
+_FFPROBE = shutil.which("ffprobe")
+
+# volumedetect's summary line, e.g. "mean_volume: -27.3 dB"
+_MEAN_VOLUME_RE = re.compile(r"mean_volume:\s*(-?(?:\d+(?:\.\d*)?|inf))\s*dB")
+
+
+@functools.cache
+def _load_env() -> None:
+    """Read .env once per process rather than on every transcriber construction."""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+
+
+@functools.cache
+def _filter_chain(clean_audio: bool, trim_silence: bool, speed: float = 1.0) -> str | None:
+    """Return the FFmpeg filter string for a cleanup combination (built once each)."""
+    if speed <= 0:
+        raise ValueError(f"speed must be positive, got {speed}")
+    
+    filters: list[str] = []
+    
+    if trim_silence:
+        # Conservative thresholds to reduce risk of clipping quiet speech.
+        filters.append(
+            "silenceremove="
+            "start_periods=1:start_duration=0.5:start_threshold=-50dB:"
+            "stop_periods=1:stop_duration=0.5:stop_threshold=-50dB"
+        )
+    
+    if clean_audio:
+        # Mild denoise + standard loudness normalization (one-pass).
+        filters.append("afftdn=nf=-25")
+        filters.append("loudnorm=I=-16:LRA=11:TP=-1.5")
+    
+    if speed != 1.0:
+        # atempo takes 0.5-2.0 per instance; chain equal steps beyond that
+        steps = 1
+        while speed ** (1 / steps) > 2.0 or speed ** (1 / steps) < 0.5:
+            steps += 1
+        filters += [f"atempo={speed ** (1 / steps):.6g}"] * steps
+    
+    return ",".join(filters) if filters else None
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """A segment of transcribed audio with timestamps."""
     
@@ -26,9 +100,18 @@ class TranscriptionSegment:
             "end": self.end,
             "text": self.text,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "TranscriptionSegment":
+        """Create a TranscriptionSegment from a dictionary."""
+        return cls(
+            start=data["start"],
+            end=data["end"],
+            text=data["text"],
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transcription:
     """Complete transcription result."""
     
@@ -43,23 +126,59 @@ class Transcription:
             "language": self.language,
             "segments": [s.to_dict() for s in self.segments],
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Transcription":
+        """Create a Transcription from a dictionary."""
+        segments = [TranscriptionSegment.from_dict(s) for s in data.get("segments", [])]
+        return cls(
+            text=data["text"],
+            language=data["language"],
+            segments=segments,
+        )
 
 
 class AudioExtractor:
     """Extract audio from video files using FFmpeg."""
     
-    def __init__(self, output_format: str = "wav", sample_rate: int = 16000):
+    # FFmpeg codec arguments per output format (also the container name)
+    CODEC_ARGS = {
+        "wav": ["-acodec", "pcm_s16le"],
+        "mp3": ["-acodec", "libmp3lame"],
+        # Speech-tuned Opus: ~10x smaller than 16-bit PCM at 16 kHz mono
+        "ogg": ["-c:a", "libopus", "-b:a", "16k", "-vbr", "on", "-application", "voip"],
+        # Lossless, roughly half the size of the same PCM
+        "flac": ["-c:a", "flac", "-compression_level", "8"],
+    }
+    
+    # Extracted files name the cleanup filters they went through in their
+    # comment tag (e.g. "filters:trim,clean"), so the upload pass can skip
+    # them instead of filtering the audio a second time
+    FILTERS_TAG_PREFIX = "filters:"
+    
+    def __init__(self, output_format: str = "wav", sample_rate: int = 16000, *, keep_hifi: bool = False):
         """
         Initialize the audio extractor.
         
         Args:
-            output_format: Audio format to extract to (wav recommended for Whisper)
+            output_format: Audio format to extract to (wav, flac, mp3 or ogg/Opus)
             sample_rate: Sample rate in Hz (16000 is optimal for Whisper)
+            keep_hifi: Extract at the source's sample rate and channel count
+                instead of `sample_rate` mono (cleanup passes still resample)
         """
+        self._codec_args(output_format)
         self.output_format = output_format
         self.sample_rate = sample_rate
+        self.keep_hifi = keep_hifi
         self._check_ffmpeg()
     
+    def _extract_layout_args(self) -> list[str]:
+        """FFmpeg arguments for the sample rate and channels of extracted audio."""
+        if self.keep_hifi:
+            return []
+        # Whisper works on 16 kHz mono; anything more is wasted upload
+        return ["-ar", str(self.sample_rate), "-ac", "1"]
+    
     @staticmethod
     def _bool_env(name: str, default: bool = False) -> bool:
         raw = os.getenv(name)
@@ -72,6 +191,7 @@ class AudioExtractor:
         *,
         clean_audio: bool,
         trim_silence: bool,
+        speed: float = 1.0,
     ) -> str | None:
         """
         Build a conservative FFmpeg audio filter chain.
@@ -79,33 +199,38 @@ class AudioExtractor:
         Notes:
         - `silenceremove` is useful but can cut quiet speech if thresholds are too high.
         - Filters are intentionally conservative; tune via code/env if needed.
+        - `speed` other than 1.0 time-stretches the audio (pitch preserved).
         """
-        filters: list[str] = []
-        
-        if trim_silence:
-            # Conservative thresholds to reduce risk of clipping quiet speech.
-            filters.append(
-                "silenceremove="
-                "start_periods=1:start_duration=0.5:start_threshold=-50dB:"
-                "stop_periods=1:stop_duration=0.5:stop_threshold=-50dB"
-            )
-        
-        if clean_audio:
-            # Mild denoise + standard loudness normalization (one-pass).
-            filters.append("afftdn=nf=-25")
-            filters.append("loudnorm=I=-16:LRA=11:TP=-1.5")
+        return _filter_chain(bool(clean_audio), bool(trim_silence), float(speed))
+    
+    @classmethod
+    def _filter_metadata(cls, *, clean_audio: bool, trim_silence: bool) -> list[str]:
+        """FFmpeg arguments recording which cleanup filters an output went through."""
+        names = [name for name, on in (("trim", trim_silence), ("clean", clean_audio)) if on]
+        if not names:
+            return []
+        return ["-metadata", f"comment={cls.FILTERS_TAG_PREFIX}{','.join(names)}"]
+    
+    @classmethod
+    def applied_filters(cls, info: dict) -> frozenset[str]:
+        """
+        Cleanup filters ("trim", "clean") recorded in an extracted file's tags.
         
-        return ",".join(filters) if filters else None
+        Args:
+            info: The file's probe() result
+        """
+        tag_sets = [info.get("format", {}).get("tags") or {}]
+        tag_sets += [stream.get("tags") or {} for stream in info.get("streams") or []]
+        for tags in tag_sets:
+            for key, value in tags.items():
+                if key.lower() == "comment" and value.startswith(cls.FILTERS_TAG_PREFIX):
+                    return frozenset(filter(None, value[len(cls.FILTERS_TAG_PREFIX):].split(",")))
+        return frozenset()
     
-    def _check_ffmpeg(self) -> None:
+    @staticmethod
+    def _check_ffmpeg() -> None:
         """Check if FFmpeg is installed and accessible."""
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True,
-            )
-        except FileNotFoundError:
+        if _FFMPEG is None:
             raise RuntimeError(
                 "FFmpeg not found. Please install FFmpeg:\n"
                 "  macOS: brew install ffmpeg\n"
@@ -113,335 +238,1723 @@ class AudioExtractor:
                 "  Windows: Download from https://ffmpeg.org/download.html"
             )
     
-    def extract_audio(
+    @classmethod
+    def _codec_args(cls, output_format: str) -> list[str]:
+        """Return the FFmpeg codec arguments for an output format."""
+        try:
+            return cls.CODEC_ARGS[output_format]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported audio format '{output_format}' "
+                f"(expected one of: {', '.join(cls.CODEC_ARGS)})"
+            ) from None
+    
+    def _extract_command(
         self,
-        video_path: str,
-        output_path: Optional[str] = None,
+        video_path: StrPath,
+        output_path: Optional[StrPath],
         *,
-        clean_audio: bool = False,
-        trim_silence: bool = False,
-    ) -> str:
-        """
-        Extract audio from a video file.
-        
-        Args:
-            video_path: Path to the input video file
-            output_path: Path for the output audio file (optional, creates temp file if not provided)
-            clean_audio: Apply denoise + loudness normalization filters
-            trim_silence: Trim leading/trailing silence (conservative thresholds)
-            
-        Returns:
-            Path to the extracted audio file
-        """
-        video_path = Path(video_path)
+        clean_audio: bool,
+        trim_silence: bool,
+        output_format: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> tuple[list[str], str]:
+        """Build the FFmpeg command for extract_audio; returns (cmd, output_path)."""
+        video_path = os.fspath(video_path)
         
-        if not video_path.exists():
+        if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
+        output_format = output_format or self.output_format
+        codec_args = self._codec_args(output_format)
+        
         if output_path is None:
             # Create a temporary file
-            fd, output_path = tempfile.mkstemp(suffix=f".{self.output_format}")
+            fd, output_path = tempfile.mkstemp(suffix=f".{output_format}")
             os.close(fd)
         
-        output_path = Path(output_path)
+        output_path = os.fspath(output_path)
         
         filter_chain = self._build_filter_chain(
             clean_audio=clean_audio,
             trim_silence=trim_silence,
+            speed=speed,
         )
         
         # FFmpeg command to extract audio
         cmd = [
-            "ffmpeg",
+            _FFMPEG,
             "-hide_banner",
             "-loglevel", "error",
-            "-i", str(video_path),
+            "-i", video_path,
             "-vn",  # No video
-            "-acodec", "pcm_s16le" if self.output_format == "wav" else "libmp3lame",
-            "-ar", str(self.sample_rate),
-            "-ac", "1",  # Mono audio
+            *codec_args,
+            *self._extract_layout_args(),
         ]
         if filter_chain:
             cmd += ["-af", filter_chain]
+            cmd += self._filter_metadata(clean_audio=clean_audio, trim_silence=trim_silence)
         
         cmd += [
             "-y",  # Overwrite output file
-            str(output_path),
+            output_path,
         ]
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"FFmpeg failed to extract audio: {e.stderr.decode()}")
-        
-        return str(output_path)
+        return cmd, output_path
     
-    def clean_audio_file(
+    def _clean_command(
         self,
-        audio_path: str,
-        output_path: Optional[str] = None,
+        audio_path: StrPath,
+        output_path: Optional[StrPath],
         *,
-        clean_audio: bool = True,
-        trim_silence: bool = True,
-    ) -> str:
-        """
-        Clean an existing audio file (denoise/normalize/trim) using FFmpeg.
+        clean_audio: bool,
+        trim_silence: bool,
+        output_format: str = "wav",
+        speed: float = 1.0,
+    ) -> tuple[list[str], str]:
+        """Build the FFmpeg command for clean_audio_file; returns (cmd, output_path)."""
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        Returns:
-            Path to cleaned WAV audio file.
-        """
-        audio_path_p = Path(audio_path)
-        if not audio_path_p.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path_p}")
+        codec_args = self._codec_args(output_format)
         
         if output_path is None:
-            fd, output_path = tempfile.mkstemp(suffix=".wav")
+            fd, output_path = tempfile.mkstemp(suffix=f".{output_format}")
             os.close(fd)
         
-        output_path_p = Path(output_path)
+        output_path = os.fspath(output_path)
         
         filter_chain = self._build_filter_chain(
             clean_audio=clean_audio,
             trim_silence=trim_silence,
+            speed=speed,
         )
         
         cmd = [
-            "ffmpeg",
+            _FFMPEG,
             "-hide_banner",
             "-loglevel", "error",
-            "-i", str(audio_path_p),
-            "-acodec", "pcm_s16le",
+            "-i", audio_path,
+            *codec_args,
             "-ar", str(self.sample_rate),
             "-ac", "1",
         ]
         if filter_chain:
             cmd += ["-af", filter_chain]
-        cmd += ["-y", str(output_path_p)]
-        
-        try:
-            subprocess.run(cmd, capture_output=True, check=True)
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"FFmpeg failed to clean audio: {e.stderr.decode()}")
+        cmd += ["-f", output_format, "-y", output_path]
         
-        return str(output_path_p)
-
-
-class OpenAITranscriber:
-    """Transcribe Farsi/Persian audio using OpenAI Whisper API."""
-    
-    # OpenAI Whisper API model
-    FALLBACK_MODEL = "whisper-1"
-    DEFAULT_BETTER_MODEL = "gpt-4o-mini-transcribe"
-    
-    # Maximum file size for OpenAI Whisper API (25MB)
-    MAX_FILE_SIZE = 25 * 1024 * 1024
-    
-    @staticmethod
-    def _bool_env(name: str, default: bool = False) -> bool:
-        raw = os.getenv(name)
-        if raw is None:
-            return default
-        return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+        return cmd, output_path
     
     @staticmethod
-    def _float_env(name: str, default: float | None = None) -> float | None:
-        raw = os.getenv(name)
-        if raw is None or raw.strip() == "":
-            return default
-        try:
-            return float(raw)
-        except ValueError:
-            return default
+    async def _run_ffmpeg_async(cmd: list[str], action: str) -> None:
+        """Run an FFmpeg command without blocking the event loop."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"FFmpeg failed to {action}: {stderr.decode()}")
     
-    def __init__(
+    def extract_audio(
         self,
-        api_key: Optional[str] = None,
-        language: str = "fa",
+        video_path: StrPath,
+        output_path: Optional[StrPath] = None,
         *,
-        model: Optional[str] = None,
-        prompt: Optional[str] = None,
-        temperature: Optional[float] = None,
-        clean_audio: Optional[bool] = None,
-        trim_silence: Optional[bool] = None,
-        audio_extractor: Optional[AudioExtractor] = None,
-    ):
+        clean_audio: bool = False,
+        trim_silence: bool = False,
+        output_format: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> str:
         """
-        Initialize the OpenAI transcriber.
+        Extract audio from a video file.
         
         Args:
-            api_key: OpenAI API key. If None, loads from OPENAI_API_KEY env var.
-            language: Language code for transcription (default: 'fa' for Farsi)
-            model: Transcription model override (else env OPENAI_TRANSCRIBE_MODEL, else default)
-            prompt: Optional prompt/hints for transcription (else env OPENAI_TRANSCRIBE_PROMPT)
-            temperature: Optional decoding temperature (else env OPENAI_TRANSCRIBE_TEMPERATURE)
-            clean_audio: Whether to run FFmpeg cleanup before upload (else env TRANSCRIBE_CLEAN_AUDIO)
-            trim_silence: Whether to trim leading/trailing silence (else env TRANSCRIBE_TRIM_SILENCE)
-            audio_extractor: Optional AudioExtractor instance for cleanup
+            video_path: Path to the input video file
+            output_path: Path for the output audio file (optional, creates temp file if not provided)
+            clean_audio: Apply denoise + loudness normalization filters
+            trim_silence: Trim leading/trailing silence (conservative thresholds)
+            output_format: Override the extractor's output format for this call
+            speed: Playback speed factor (FFmpeg atempo); 1.0 leaves it unchanged
+            
+        Returns:
+            Path to the extracted audio file
         """
-        load_dotenv()
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        
-        if not self.api_key:
-            raise ValueError(
-                "OpenAI API key not found. Please set OPENAI_API_KEY environment variable "
-                "or pass api_key parameter."
-            )
-        
-        self.language = language
-        self.client = OpenAI(api_key=self.api_key)
-        
-        # Configurable transcription controls (args > env > defaults)
-        self.model = (
-            model
-            or os.getenv("OPENAI_TRANSCRIBE_MODEL")
-            or self.DEFAULT_BETTER_MODEL
+        cmd, output_path = self._extract_command(
+            video_path,
+            output_path,
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+            output_format=output_format,
+            speed=speed,
         )
         
-        self.prompt = prompt if prompt is not None else os.getenv("OPENAI_TRANSCRIBE_PROMPT")
-        if self.prompt is not None and self.prompt.strip() == "":
-            self.prompt = None
-        
-        self.temperature = temperature if temperature is not None else self._float_env("OPENAI_TRANSCRIBE_TEMPERATURE", default=None)
-        
-        # Default on (per plan); allow env/args to disable.
-        self.clean_audio = clean_audio if clean_audio is not None else self._bool_env("TRANSCRIBE_CLEAN_AUDIO", default=True)
-        self.trim_silence = trim_silence if trim_silence is not None else self._bool_env("TRANSCRIBE_TRIM_SILENCE", default=True)
+        try:
+            subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to extract audio: {e.stderr.decode()}")
         
-        self.audio_extractor = audio_extractor
+        return output_path
     
-    def transcribe(
+    def extract_audio_many(
         self,
-        audio_path: str,
-        return_timestamps: bool = True,
+        jobs: list[tuple[StrPath, StrPath]],
         *,
-        model: Optional[str] = None,
-        prompt: Optional[str] = None,
-        temperature: Optional[float] = None,
-        clean_audio: Optional[bool] = None,
-        trim_silence: Optional[bool] = None,
-    ) -> Transcription:
+        clean_audio: bool = False,
+        trim_silence: bool = False,
+        output_format: Optional[str] = None,
+    ) -> list[str]:
         """
-        Transcribe an audio file using OpenAI Whisper API.
+        Extract audio from several videos with a single FFmpeg process.
+        
+        Saves the process startup that extract_audio pays per video. One bad
+        input (e.g. no audio stream) fails the whole command; callers can
+        then fall back to extract_audio per video.
         
         Args:
-            audio_path: Path to the audio file
-            return_timestamps: Whether to include segment timestamps
-            model: Optional override model for this call
-            prompt: Optional override prompt for this call
-            temperature: Optional override temperature for this call
-            clean_audio: Optional override cleanup (FFmpeg) for this call
-            trim_silence: Optional override trimming for this call
+            jobs: (video_path, output_path) pairs
+            clean_audio: Apply denoise + loudness normalization filters
+            trim_silence: Trim leading/trailing silence (conservative thresholds)
+            output_format: Override the extractor's output format for this call
             
         Returns:
-            Transcription object with text and optional segments
+            Paths to the extracted audio files, in job order
         """
-        audio_path_p = Path(audio_path)
-        if not audio_path_p.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path_p}")
+        output_format = output_format or self.output_format
+        codec_args = self._codec_args(output_format)
+        filter_chain = self._build_filter_chain(
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+        )
         
-        selected_model = model or self.model
-        selected_prompt = prompt if prompt is not None else self.prompt
-        selected_temperature = temperature if temperature is not None else self.temperature
-        do_clean = clean_audio if clean_audio is not None else self.clean_audio
-        do_trim = trim_silence if trim_silence is not None else self.trim_silence
+        cmd = [_FFMPEG, "-hide_banner", "-loglevel", "error"]
+        for video_path, _ in jobs:
+            video_path = os.fspath(video_path)
+            if not os.path.exists(video_path):
+                raise FileNotFoundError(f"Video file not found: {video_path}")
+            cmd += ["-i", video_path]
+        
+        # Output options apply to the output file that follows them
+        output_paths = []
+        for k, (_, output_path) in enumerate(jobs):
+            output_paths.append(os.fspath(output_path))
+            cmd += [
+                "-map", f"{k}:a:0",
+                *codec_args,
+                *self._extract_layout_args(),
+            ]
+            if filter_chain:
+                cmd += ["-af", filter_chain]
+                cmd += self._filter_metadata(clean_audio=clean_audio, trim_silence=trim_silence)
+            cmd += ["-f", output_format, "-y", output_paths[-1]]
         
-        upload_path = audio_path_p
-        temp_clean_path: str | None = None
         try:
-            if do_clean or do_trim:
-                extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
-                temp_clean_path = extractor.clean_audio_file(
-                    str(audio_path_p),
-                    clean_audio=do_clean,
-                    trim_silence=do_trim,
-                )
-                upload_path = Path(temp_clean_path)
-        
-            # Check file size (after optional cleanup)
-            file_size = upload_path.stat().st_size
-            if file_size > self.MAX_FILE_SIZE:
-                raise ValueError(
-                    f"Audio file is too large ({file_size / 1024 / 1024:.1f}MB). "
-                    f"OpenAI Whisper API has a 25MB limit."
-                )
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to extract audio: {e.stderr.decode()}")
         
-            def _create_transcription(*, model_name: str):
-                with open(upload_path, "rb") as audio_file:
-                    base_kwargs: dict = {
-                        "model": model_name,
-                        "file": audio_file,
-                        "language": self.language,
-                    }
-                    if selected_prompt:
-                        base_kwargs["prompt"] = selected_prompt
-                    if selected_temperature is not None:
-                        base_kwargs["temperature"] = selected_temperature
-                    
-                    if return_timestamps:
-                        base_kwargs["response_format"] = "verbose_json"
-                        base_kwargs["timestamp_granularities"] = ["segment"]
-                    else:
-                        base_kwargs["response_format"] = "text"
-                    
-                    return self.client.audio.transcriptions.create(**base_kwargs)
-            
-            try:
-                result = _create_transcription(model_name=selected_model)
-            except Exception as e:
-                # Safe fallback if the "better" model isn't available on the account/project.
-                # We retry once with whisper-1 to avoid breaking existing workflows.
-                msg = str(e).lower()
-                if selected_model != self.FALLBACK_MODEL and (
-                    "model" in msg and ("not found" in msg or "does not exist" in msg or "invalid" in msg)
-                ):
-                    print(f"Warning: model '{selected_model}' unavailable; retrying with '{self.FALLBACK_MODEL}'.")
-                    result = _create_transcription(model_name=self.FALLBACK_MODEL)
-                else:
-                    raise
-                
-            if return_timestamps:
-                full_text = result.text.strip() if getattr(result, "text", None) else ""
-                segments: list[TranscriptionSegment] = []
-                
-                if hasattr(result, "segments") and result.segments:
-                    for seg in result.segments:
-                        segments.append(
-                            TranscriptionSegment(
-                                start=seg.get("start", 0.0) if isinstance(seg, dict) else getattr(seg, "start", 0.0),
-                                end=seg.get("end", 0.0) if isinstance(seg, dict) else getattr(seg, "end", 0.0),
-                                text=(seg.get("text", "") if isinstance(seg, dict) else getattr(seg, "text", "")).strip(),
-                            )
-                        )
-                
-                return Transcription(text=full_text, language=self.language, segments=segments)
-            
-            # Simple text response
-            if isinstance(result, str):
-                text_out = result.strip()
-            else:
-                text_out = (getattr(result, "text", "") or "").strip()
-            
-            return Transcription(text=text_out, language=self.language, segments=[])
-        finally:
-            if temp_clean_path and os.path.exists(temp_clean_path):
-                try:
-                    os.remove(temp_clean_path)
-                except OSError:
-                    pass
+        return output_paths
     
-    def transcribe_video(
+    async def extract_audio_async(
         self,
-        video_path: str,
-        audio_extractor: Optional[AudioExtractor] = None,
-        return_timestamps: bool = True,
-        keep_audio: bool = False,
-    ) -> Transcription:
+        video_path: StrPath,
+        output_path: Optional[StrPath] = None,
+        *,
+        clean_audio: bool = False,
+        trim_silence: bool = False,
+        output_format: Optional[str] = None,
+        speed: float = 1.0,
+    ) -> str:
+        """Async version of extract_audio, so several extractions can run at once."""
+        cmd, output_path = self._extract_command(
+            video_path,
+            output_path,
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+            output_format=output_format,
+            speed=speed,
+        )
+        await self._run_ffmpeg_async(cmd, "extract audio")
+        return output_path
+    
+    def clean_audio_file(
+        self,
+        audio_path: StrPath,
+        output_path: Optional[StrPath] = None,
+        *,
+        clean_audio: bool = True,
+        trim_silence: bool = True,
+        output_format: str = "wav",
+        speed: float = 1.0,
+    ) -> str:
         """
-        Transcribe audio from a video file.
+        Clean an existing audio file (denoise/normalize/trim) using FFmpeg.
+        
+        Returns:
+            Path to cleaned audio file (WAV unless output_format is given).
+        """
+        cmd, output_path = self._clean_command(
+            audio_path,
+            output_path,
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+            output_format=output_format,
+            speed=speed,
+        )
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to clean audio: {e.stderr.decode()}")
+        
+        return output_path
+    
+    def clean_audio_to_bytes(
+        self,
+        audio_path: StrPath,
+        *,
+        clean_audio: bool = True,
+        trim_silence: bool = True,
+        output_format: str = "wav",
+        speed: float = 1.0,
+    ) -> bytes:
+        """
+        Clean an audio file like clean_audio_file, but return the encoded bytes.
+        
+        FFmpeg writes to stdout, so no temporary file is written and read back.
+        
+        Returns:
+            Cleaned audio as bytes (WAV unless output_format is given).
+        """
+        cmd, _ = self._clean_command(
+            audio_path,
+            "pipe:1",
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+            output_format=output_format,
+            speed=speed,
+        )
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to clean audio: {e.stderr.decode()}")
+        
+        return result.stdout
+    
+    async def clean_audio_file_async(
+        self,
+        audio_path: StrPath,
+        output_path: Optional[StrPath] = None,
+        *,
+        clean_audio: bool = True,
+        trim_silence: bool = True,
+        output_format: str = "wav",
+        speed: float = 1.0,
+    ) -> str:
+        """Async version of clean_audio_file, so several cleanups can run at once."""
+        cmd, output_path = self._clean_command(
+            audio_path,
+            output_path,
+            clean_audio=clean_audio,
+            trim_silence=trim_silence,
+            output_format=output_format,
+            speed=speed,
+        )
+        await self._run_ffmpeg_async(cmd, "clean audio")
+        return output_path
+    
+    def decode_pcm(self, audio_path: StrPath) -> bytes:
+        """
+        Decode an audio file to raw 16-bit mono PCM at `sample_rate`.
+        
+        Returns:
+            Raw signed 16-bit little-endian samples (no header)
+        """
+        cmd = [
+            _FFMPEG,
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", os.fspath(audio_path),
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(self.sample_rate),
+            "-ac", "1",
+            "pipe:1",
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to decode audio: {e.stderr.decode()}")
+        
+        return result.stdout
+    
+    def keep_intervals(
+        self,
+        audio_path: StrPath,
+        intervals: list[tuple[float, float]],
+        output_path: StrPath,
+        output_format: str = "wav",
+    ) -> str:
+        """
+        Write only the given time intervals of an audio file, joined back to back.
+        
+        Args:
+            audio_path: Path to the source audio file
+            intervals: (start, end) intervals in seconds to keep
+            output_path: Path for the output audio file
+            output_format: Output audio format
+            
+        Returns:
+            Path to the output audio file
+        """
+        # Touching or overlapping intervals select the same samples as one
+        merged: list[list[float]] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        selection = "+".join(f"between(t,{start:.3f},{end:.3f})" for start, end in merged)
+        
+        # A long recording can have thousands of intervals, too many for one
+        # command-line argument, so the filter is read from a file instead
+        fd, script_path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(f"aselect='{selection}',asetpts=N/SR/TB")
+        
+        cmd = [
+            _FFMPEG,
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", os.fspath(audio_path),
+            *self._codec_args(output_format),
+            "-ar", str(self.sample_rate),
+            "-ac", "1",
+            "-filter_script:a", script_path,
+            "-f", output_format,
+            "-y", os.fspath(output_path),
+        ]
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to cut audio: {e.stderr.decode()}")
+        finally:
+            os.remove(script_path)
+        
+        return os.fspath(output_path)
+    
+    def concat_audio(
+        self,
+        audio_paths: list[StrPath],
+        output_path: StrPath,
+        gap_seconds: float = 1.0,
+        output_format: str = "wav",
+    ) -> list[float]:
+        """
+        Join audio files back to back, with silence between them.
+        
+        Args:
+            audio_paths: Audio files to join, in order
+            output_path: Path for the joined audio file
+            gap_seconds: Silence appended after each file
+            output_format: Output audio format
+            
+        Returns:
+            Start offset in seconds of each input within the joined audio
+        """
+        offsets = []
+        position = 0.0
+        for audio_path in audio_paths:
+            duration = self.duration(audio_path)
+            if duration is None:
+                raise RuntimeError(f"Could not read the duration of {os.fspath(audio_path)}")
+            offsets.append(position)
+            position += duration + gap_seconds
+        
+        inputs = []
+        filters = []
+        for k, audio_path in enumerate(audio_paths):
+            inputs += ["-i", os.fspath(audio_path)]
+            filters.append(
+                f"[{k}:a]aformat=sample_rates={self.sample_rate}:channel_layouts=mono,"
+                f"apad=pad_dur={gap_seconds}[a{k}]"
+            )
+        labels = "".join(f"[a{k}]" for k in range(len(audio_paths)))
+        filters.append(f"{labels}concat=n={len(audio_paths)}:v=0:a=1[out]")
+        
+        cmd = [
+            _FFMPEG,
+            "-hide_banner",
+            "-loglevel", "error",
+            *inputs,
+            "-filter_complex", ";".join(filters),
+            "-map", "[out]",
+            *self._codec_args(output_format),
+            "-ar", str(self.sample_rate),
+            "-ac", "1",
+            "-f", output_format,
+            "-y", os.fspath(output_path),
+        ]
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to join audio: {e.stderr.decode()}")
+        
+        return offsets
+    
+    def probe(self, audio_path: StrPath) -> dict:
+        """
+        Read stream and container info for an audio file with ffprobe.
+        
+        Returns:
+            Parsed ffprobe JSON ("streams" and "format"), or an empty dict
+            if ffprobe is unavailable or fails
+        """
+        if _FFPROBE is None:
+            return {}
+        
+        cmd = [
+            _FFPROBE,
+            "-v", "error",
+            "-print_format", "json",
+            "-show_streams",
+            "-show_format",
+            os.fspath(audio_path),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            return json.loads(result.stdout)
+        except (subprocess.CalledProcessError, ValueError):
+            return {}
+    
+    def mean_volume(self, audio_path: StrPath) -> float | None:
+        """
+        Mean volume of an audio file in dBFS, via FFmpeg's volumedetect filter.
+        
+        Returns:
+            The mean volume (-91 dB or lower is digital silence), or None if
+            FFmpeg fails (e.g. the file has no audio stream)
+        """
+        cmd = [
+            _FFMPEG,
+            "-hide_banner",
+            "-nostats",
+            "-i", os.fspath(audio_path),
+            "-af", "volumedetect",
+            "-f", "null",
+            "-",
+        ]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            return None
+        
+        match = _MEAN_VOLUME_RE.search(result.stderr.decode(errors="replace"))
+        return float(match[1]) if match else None
+    
+    def duration(self, audio_path: StrPath) -> float | None:
+        """Length of an audio file in seconds, or None if ffprobe can't tell."""
+        try:
+            return float(self.probe(audio_path)["format"]["duration"])
+        except (KeyError, ValueError):
+            return None
+    
+    def split_audio(
+        self,
+        audio_path: StrPath,
+        output_dir: StrPath,
+        segment_seconds: int = 600,
+        overlap_seconds: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """
+        Split an audio file into fixed-length chunks without re-encoding.
+        
+        Args:
+            audio_path: Path to the audio file to split
+            output_dir: Directory to write the chunk files to
+            segment_seconds: Target length of each chunk in seconds
+            overlap_seconds: Extra seconds each chunk runs into the next one,
+                so words cut at a boundary are heard whole by one of them
+            
+        Returns:
+            List of (chunk_path, start_offset_seconds) in playback order
+        """
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        output_dir = os.fspath(output_dir)
+        segment_list = os.path.join(output_dir, "segments.csv")
+        suffix = os.path.splitext(audio_path)[1]
+        
+        if overlap_seconds > 0:
+            return self._split_overlapping(
+                audio_path, output_dir, suffix, segment_seconds, overlap_seconds
+            )
+        
+        cmd = [
+            _FFMPEG,
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", audio_path,
+            "-f", "segment",
+            "-segment_time", str(segment_seconds),
+            "-segment_list", segment_list,
+            "-segment_list_type", "csv",
+            "-c", "copy",
+            "-y", os.path.join(output_dir, f"chunk_%03d{suffix}"),
+        ]
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to split audio: {e.stderr.decode()}")
+        
+        # Each row is: filename,start_time,end_time
+        with open(segment_list, "r", encoding="utf-8", newline="") as f:
+            return [
+                (os.path.join(output_dir, row[0]), float(row[1]))
+                for row in csv.reader(f)
+                if row
+            ]
+    
+    def _split_overlapping(
+        self,
+        audio_path: str,
+        output_dir: str,
+        suffix: str,
+        segment_seconds: int,
+        overlap_seconds: float,
+    ) -> list[tuple[str, float]]:
+        """split_audio with overlap: one FFmpeg process writing a trimmed copy per chunk."""
+        duration = self.duration(audio_path)
+        if duration is None:
+            raise RuntimeError(f"Could not determine the length of {audio_path}")
+        
+        chunks: list[tuple[str, float]] = []
+        cmd = [_FFMPEG, "-hide_banner", "-loglevel", "error", "-i", audio_path]
+        # A chunk starting within the last overlap would only repeat audio
+        # the previous chunk already covers
+        start = 0.0
+        while not chunks or start + overlap_seconds < duration:
+            chunk_path = os.path.join(output_dir, f"chunk_{len(chunks):03d}{suffix}")
+            chunks.append((chunk_path, start))
+            cmd += [
+                "-map", "0:a:0",
+                "-ss", f"{start:.3f}",
+                "-t", f"{segment_seconds + overlap_seconds:.3f}",
+                "-c", "copy",
+                "-y", chunk_path,
+            ]
+            start += segment_seconds
+        
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed to split audio: {e.stderr.decode()}")
+        
+        return chunks
+
+
+class OpenAITranscriber:
+    """Transcribe Farsi/Persian audio using OpenAI Whisper API."""
+    
+    # OpenAI Whisper API model
+    FALLBACK_MODEL = "whisper-1"
+    DEFAULT_BETTER_MODEL = "gpt-4o-mini-transcribe"
+    
+    # Maximum file size for OpenAI Whisper API (25MB)
+    MAX_FILE_SIZE = 25 * 1024 * 1024
+    
+    # Chunk length used when splitting files over MAX_FILE_SIZE
+    CHUNK_SECONDS = 600
+    
+    # Consecutive chunks share this much audio; each segment is taken from
+    # exactly one chunk, by which side of the overlap's middle it starts on
+    CHUNK_OVERLAP_SECONDS = 2.0
+    
+    # Default number of chunks transcribed in parallel
+    DEFAULT_CONCURRENCY = 5
+    
+    # Transient API errors (429/5xx/timeouts) are retried with jittered
+    # exponential backoff: 0.5s, 1s, 2s, 4s (capped at RETRY_MAX_DELAY)
+    RETRY_ATTEMPTS = 5
+    RETRY_INITIAL_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+    
+    # A 429 halves the request rate for this long, and a Retry-After
+    # header is honored up to RETRY_AFTER_MAX seconds
+    RATE_LIMIT_COOLDOWN = 60.0
+    RETRY_AFTER_MAX = 60.0
+    
+    # Short clips already in upload shape skip the cleanup pass
+    SKIP_CLEAN_MAX_SECONDS = 30
+    
+    # Audio format for uploads: Opus is ~10x smaller than 16-bit PCM WAV
+    DEFAULT_UPLOAD_FORMAT = "ogg"
+    
+    # Silence between clips joined by transcribe_batch
+    BATCH_GAP_SECONDS = 1.0
+    
+    # Files quieter than this on average (dBFS) hold no speech worth uploading
+    SILENT_MEAN_VOLUME_DB = -60.0
+    
+    # Transcription result cache (in-process LRU in front of an on-disk SQLite index)
+    DEFAULT_CACHE_DIR = "~/.cache/twitterscrapper/transcripts"
+    MEMORY_CACHE_SIZE = 32
+    DISK_CACHE_SIZE = 10_000
+    
+    # Keep-alive HTTP pools shared by every transcriber using the same API key
+    _http_clients: dict[str, "httpx.Client"] = {}
+    _http_clients_lock = threading.Lock()
+    
+    @staticmethod
+    def _bool_env(name: str, default: bool = False) -> bool:
+        raw = os.getenv(name)
+        if raw is None:
+            return default
+        return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+    
+    @staticmethod
+    def _float_env(name: str, default: float | None = None) -> float | None:
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return default
+        try:
+            return float(raw)
+        except ValueError:
+            return default
+    
+    @staticmethod
+    def _int_env(name: str, default: int) -> int:
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return default
+        try:
+            return int(raw)
+        except ValueError:
+            return default
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        language: str = "fa",
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+        audio_extractor: Optional[AudioExtractor] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        upload_format: Optional[str] = None,
+        use_vad: Optional[bool] = None,
+        requests_per_minute: Optional[float] = None,
+        speed: Optional[float] = None,
+    ):
+        """
+        Initialize the OpenAI transcriber.
+        
+        Args:
+            api_key: OpenAI API key. If None, loads from OPENAI_API_KEY env var.
+            language: Language code for transcription (default: 'fa' for Farsi)
+            model: Transcription model override (else env OPENAI_TRANSCRIBE_MODEL, else default)
+            prompt: Optional prompt/hints for transcription (else env OPENAI_TRANSCRIBE_PROMPT)
+            temperature: Optional decoding temperature (else env OPENAI_TRANSCRIBE_TEMPERATURE)
+            clean_audio: Whether to run FFmpeg cleanup before upload (else env TRANSCRIBE_CLEAN_AUDIO)
+            trim_silence: Whether to trim leading/trailing silence (else env TRANSCRIBE_TRIM_SILENCE)
+            audio_extractor: Optional AudioExtractor instance for cleanup
+            cache_dir: Directory for cached transcripts (else env TRANSCRIBE_CACHE_DIR, else default)
+            use_cache: Whether to reuse cached transcripts (else env TRANSCRIBE_CACHE, default on)
+            upload_format: Format FFmpeg encodes uploads to: ogg (Opus), flac or wav (else env TRANSCRIBE_UPLOAD_FORMAT, default ogg)
+            use_vad: Drop non-speech audio before upload using webrtcvad (else env TRANSCRIBE_VAD, default off)
+            requests_per_minute: Cap on API requests started per minute, shared by
+                every thread using this transcriber (else env OPENAI_TRANSCRIBE_RPM; 0/None = no cap)
+            speed: Tempo factor applied before upload, e.g. 1.5 (else env TRANSCRIBE_SPEED, default 1.0).
+                Shorter audio is cheaper and faster to transcribe; timestamps are scaled back.
+        """
+        _load_env()
+        self._connect(api_key)
+        
+        self.language = language
+        
+        # Configurable transcription controls (args > env > defaults)
+        self.model = (
+            model
+            or os.getenv("OPENAI_TRANSCRIBE_MODEL")
+            or self.DEFAULT_BETTER_MODEL
+        )
+        
+        self.prompt = prompt if prompt is not None else os.getenv("OPENAI_TRANSCRIBE_PROMPT")
+        if self.prompt is not None and self.prompt.strip() == "":
+            self.prompt = None
+        
+        self.temperature = temperature if temperature is not None else self._float_env("OPENAI_TRANSCRIBE_TEMPERATURE", default=None)
+        
+        # Default on (per plan); allow env/args to disable.
+        self.clean_audio = clean_audio if clean_audio is not None else self._bool_env("TRANSCRIBE_CLEAN_AUDIO", default=True)
+        self.trim_silence = trim_silence if trim_silence is not None else self._bool_env("TRANSCRIBE_TRIM_SILENCE", default=True)
+        
+        self.audio_extractor = audio_extractor
+        
+        # Audio that FFmpeg prepares for upload is encoded in this format
+        self.upload_format = (
+            upload_format
+            or os.getenv("TRANSCRIBE_UPLOAD_FORMAT", "").strip().lower()
+            or self.DEFAULT_UPLOAD_FORMAT
+        )
+        AudioExtractor._codec_args(self.upload_format)
+        
+        # Speeding audio up cuts billed minutes; 1.5x is safe for speech
+        self.speed = speed if speed is not None else self._float_env("TRANSCRIBE_SPEED", default=1.0)
+        if self.speed <= 0:
+            raise ValueError(f"speed must be positive, got {self.speed}")
+        
+        # Voice activity detection is optional (needs webrtcvad)
+        self.use_vad = use_vad if use_vad is not None else self._bool_env("TRANSCRIBE_VAD", default=False)
+        if self.use_vad and not VADFilter.available():
+            print("Warning: webrtcvad is not installed; voice activity detection is disabled.")
+            self.use_vad = False
+        
+        # Results are cached by audio content + request parameters, so
+        # re-running on identical audio never pays for a second API call
+        self.use_cache = use_cache if use_cache is not None else self._bool_env("TRANSCRIBE_CACHE", default=True)
+        self.cache_dir = Path(
+            cache_dir or os.getenv("TRANSCRIBE_CACHE_DIR") or self.DEFAULT_CACHE_DIR
+        ).expanduser()
+        self._memory_cache: OrderedDict[str, Transcription] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # On disk: one SQLite index, trimmed to the most recently used
+        # transcripts (env TRANSCRIBE_CACHE_MAX_ENTRIES; 0 = unlimited)
+        max_entries = self._int_env("TRANSCRIBE_CACHE_MAX_ENTRIES", self.DISK_CACHE_SIZE)
+        self._disk_cache = TranscriptCache(self.cache_dir, max_entries=max_entries or None)
+        
+        # Max chunks of a long file in flight at once (env OPENAI_TRANSCRIBE_CONCURRENCY)
+        self.max_concurrent = max(1, self._int_env("OPENAI_TRANSCRIBE_CONCURRENCY", self.DEFAULT_CONCURRENCY))
+        
+        # Requests (including retries) are spaced out to stay under the
+        # account's rate limit instead of bouncing off 429s
+        self.requests_per_minute = (
+            requests_per_minute
+            if requests_per_minute is not None
+            else self._float_env("OPENAI_TRANSCRIBE_RPM", default=None)
+        )
+        self._rate_limiter = (
+            RateLimiter(self.requests_per_minute / 60)
+            if self.requests_per_minute and self.requests_per_minute > 0
+            else None
+        )
+    
+    def _connect(self, api_key: Optional[str]) -> None:
+        """Set up the API client (subclasses with another backend override this)."""
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        
+        if not self.api_key:
+            raise ValueError(
+                "OpenAI API key not found. Please set OPENAI_API_KEY environment variable "
+                "or pass api_key parameter."
+            )
+        
+        from openai import OpenAI
+        
+        # Retries are handled by _with_retries so they don't compound with
+        # the SDK's own
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=self._shared_http_client(self.api_key),
+            max_retries=0,
+        )
+    
+    @classmethod
+    def _shared_http_client(cls, api_key: str) -> "httpx.Client":
+        """Return the pooled HTTP client for an API key, creating it on first use."""
+        import httpx
+        
+        with cls._http_clients_lock:
+            client = cls._http_clients.get(api_key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=16,
+                        keepalive_expiry=60,
+                    ),
+                    timeout=httpx.Timeout(600.0, connect=10.0),
+                    # Concurrent uploads share one connection over HTTP/2
+                    http2=_HTTP2,
+                )
+                cls._http_clients[api_key] = client
+            return client
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections and the cache database used by this transcriber."""
+        self._disk_cache.close()
+        with self._http_clients_lock:
+            client = self._http_clients.pop(self.api_key, None)
+        if client is not None:
+            client.close()
+    
+    def transcribe(
+        self,
+        audio_path: StrPath,
+        return_timestamps: bool = True,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+        prepared: bool = False,
+        force_clean: bool = False,
+    ) -> Transcription:
+        """
+        Transcribe an audio file using OpenAI Whisper API.
+        
+        Args:
+            audio_path: Path to the audio file
+            return_timestamps: Whether to include segment timestamps
+            model: Optional override model for this call
+            prompt: Optional override prompt for this call
+            temperature: Optional override temperature for this call
+            clean_audio: Optional override cleanup (FFmpeg) for this call
+            trim_silence: Optional override trimming for this call
+            prepared: The audio was already filtered (and sped up, see
+                `speed`) during extraction, so skip the separate FFmpeg pass
+            force_clean: Run the cleanup pass even for short clips that are
+                already 16 kHz mono PCM/Opus
+            
+        Returns:
+            Transcription object with text and optional segments
+        """
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        do_clean = clean_audio if clean_audio is not None else self.clean_audio
+        do_trim = trim_silence if trim_silence is not None else self.trim_silence
+        do_speed = self.speed != 1.0 and not prepared
+        if prepared:
+            do_clean = do_trim = False
+        
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        do_clean, do_trim = self._cleanup_plan(
+            extractor, audio_path, do_clean, do_trim, skip_ready=not force_clean
+        )
+        
+        # Timestamps of sped-up audio are scaled back to the original timeline
+        time_scale = self.speed if do_speed else 1.0
+        
+        if do_clean or do_trim or do_speed:
+            audio_bytes = extractor.clean_audio_to_bytes(
+                audio_path,
+                clean_audio=do_clean,
+                trim_silence=do_trim,
+                output_format=self.upload_format,
+                speed=time_scale,
+            )
+            stem = os.path.splitext(os.path.basename(audio_path))[0]
+            upload_name = f"{stem}.{self.upload_format}"
+        else:
+            with open(audio_path, "rb") as f:
+                audio_bytes = f.read()
+            upload_name = os.path.basename(audio_path)
+        
+        transcription = self._transcribe_bytes(
+            audio_bytes,
+            upload_name,
+            return_timestamps,
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+        )
+        return self._rescaled(transcription, time_scale)
+    
+    def transcribe_bytes(
+        self,
+        audio_bytes: bytes,
+        upload_name: str,
+        return_timestamps: bool = True,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> Transcription:
+        """
+        Transcribe audio already prepared in memory (see prepare_upload_bytes).
+        
+        Args:
+            audio_bytes: Encoded audio, at most MAX_FILE_SIZE bytes
+            upload_name: File name sent with the upload; its extension tells
+                the API the format
+            return_timestamps: Whether to include segment timestamps
+            model: Optional override model for this call
+            prompt: Optional override prompt for this call
+            temperature: Optional override temperature for this call
+            
+        Returns:
+            Transcription object with text and optional segments
+        """
+        transcription = self._transcribe_bytes(
+            audio_bytes,
+            upload_name,
+            return_timestamps,
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+        )
+        return self._rescaled(transcription, self.speed)
+    
+    def _transcribe_bytes(
+        self,
+        audio_bytes: bytes,
+        upload_name: str,
+        return_timestamps: bool,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> Transcription:
+        """Upload encoded audio (with caching and retries) and parse the result."""
+        selected_model = model or self.model
+        selected_prompt = prompt if prompt is not None else self.prompt
+        selected_temperature = temperature if temperature is not None else self.temperature
+        
+        # Check file size (after optional cleanup)
+        file_size = len(audio_bytes)
+        if file_size > self.MAX_FILE_SIZE:
+            raise ValueError(
+                f"Audio file is too large ({file_size / 1024 / 1024:.1f}MB). "
+                f"OpenAI Whisper API has a 25MB limit."
+            )
+        
+        # The same buffer feeds the cache key and the upload (including a
+        # fallback retry)
+        upload_file = (
+            upload_name,
+            audio_bytes,
+            mimetypes.guess_type(upload_name)[0] or "application/octet-stream",
+        )
+        
+        def _create_transcription(*, model_name: str):
+            base_kwargs: dict = {
+                "model": model_name,
+                "file": upload_file,
+                "language": self.language,
+            }
+            if selected_prompt:
+                base_kwargs["prompt"] = selected_prompt
+            if selected_temperature is not None:
+                base_kwargs["temperature"] = selected_temperature
+            
+            if return_timestamps:
+                base_kwargs["response_format"] = "verbose_json"
+                base_kwargs["timestamp_granularities"] = ["segment"]
+            else:
+                base_kwargs["response_format"] = "text"
+            
+            return self._with_retries(
+                lambda: self.client.audio.transcriptions.create(**base_kwargs)
+            )
+        
+        cache_key = None
+        if self.use_cache:
+            cache_key = self._cache_key(
+                audio_bytes,
+                model=selected_model,
+                prompt=selected_prompt,
+                temperature=selected_temperature,
+                return_timestamps=return_timestamps,
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                print("  Using cached transcript")
+                return cached
+        
+        try:
+            result = _create_transcription(model_name=selected_model)
+        except Exception as e:
+            # Safe fallback if the "better" model isn't available on the account/project.
+            # We retry once with whisper-1 to avoid breaking existing workflows.
+            msg = str(e).lower()
+            if selected_model != self.FALLBACK_MODEL and (
+                "model" in msg and ("not found" in msg or "does not exist" in msg or "invalid" in msg)
+            ):
+                print(f"Warning: model '{selected_model}' unavailable; retrying with '{self.FALLBACK_MODEL}'.")
+                result = _create_transcription(model_name=self.FALLBACK_MODEL)
+            else:
+                raise
+            
+        transcription = self._parse_result(result, return_timestamps)
+        if cache_key is not None:
+            self._cache_put(cache_key, transcription)
+        return transcription
+    
+    @staticmethod
+    def _rescaled(transcription: Transcription, factor: float) -> Transcription:
+        """Multiply segment timestamps by `factor` (undoing a speed-up of the audio)."""
+        if factor == 1.0:
+            return transcription
+        return Transcription(
+            text=transcription.text,
+            language=transcription.language,
+            segments=[
+                TranscriptionSegment(start=seg.start * factor, end=seg.end * factor, text=seg.text)
+                for seg in transcription.segments
+            ],
+        )
+    
+    def _with_retries(self, call):
+        """
+        Run an API call, retrying transient failures with jittered backoff.
+        
+        A server-sent Retry-After overrides the backoff delay, and a 429 also
+        halves the shared request rate for RATE_LIMIT_COOLDOWN seconds, so
+        other threads back off too instead of each running into the limit.
+        """
+        import openai
+        
+        # Transient API errors: 429, 5xx, timeouts and dropped connections
+        retryable_errors = (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.wait()
+            try:
+                return call()
+            except retryable_errors as e:
+                if attempt == self.RETRY_ATTEMPTS:
+                    raise
+                delay = min(self.RETRY_INITIAL_DELAY * 2 ** (attempt - 1), self.RETRY_MAX_DELAY)
+                delay += random.uniform(0, delay / 2)
+                retry_after = self._retry_after(e)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                if isinstance(e, openai.RateLimitError) and self._rate_limiter is not None:
+                    self._rate_limiter.slow_down(2.0, self.RATE_LIMIT_COOLDOWN, pause=retry_after or 0.0)
+                print(f"  Warning: {type(e).__name__}; retrying in {delay:.1f}s ({attempt}/{self.RETRY_ATTEMPTS - 1})")
+                time.sleep(delay)
+    
+    @classmethod
+    def _retry_after(cls, error: Exception) -> Optional[float]:
+        """Seconds the server asked us to wait (Retry-After / retry-after-ms), if any."""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+        try:
+            if headers.get("retry-after-ms"):
+                seconds = float(headers["retry-after-ms"]) / 1000
+            elif headers.get("retry-after"):
+                # HTTP-date values are rare here; only delta-seconds are parsed
+                seconds = float(headers["retry-after"])
+            else:
+                return None
+        except ValueError:
+            return None
+        return min(max(seconds, 0.0), cls.RETRY_AFTER_MAX)
+    
+    def _cleanup_plan(
+        self,
+        extractor: AudioExtractor,
+        audio_path: str,
+        do_clean: bool,
+        do_trim: bool,
+        *,
+        skip_ready: bool = True,
+    ) -> tuple[bool, bool]:
+        """
+        Decide which cleanup filters a file still needs, from one ffprobe call.
+        
+        Filters already applied during extraction are dropped, and with
+        `skip_ready` (and no speed change) short clips already in upload
+        shape need none.
+        
+        Returns:
+            (clean_audio, trim_silence) to run
+        """
+        if not (do_clean or do_trim):
+            return False, False
+        
+        info = extractor.probe(audio_path)
+        applied = AudioExtractor.applied_filters(info)
+        do_clean = do_clean and "clean" not in applied
+        do_trim = do_trim and "trim" not in applied
+        if skip_ready and self.speed == 1.0 and self._is_upload_ready(info):
+            return False, False
+        return do_clean, do_trim
+    
+    def _is_upload_ready(self, info: dict) -> bool:
+        """Whether a probed file is a short 16 kHz mono PCM/FLAC/Opus clip not worth cleaning."""
+        streams = info.get("streams") or []
+        if len(streams) != 1:
+            return False
+        
+        stream = streams[0]
+        codec = stream.get("codec_name")
+        try:
+            duration = float(info.get("format", {}).get("duration", "inf"))
+            sample_rate = int(stream.get("sample_rate", 0))
+        except ValueError:
+            return False
+        
+        # Opus always reports its 48 kHz decode rate, so only PCM is rate-checked
+        return (
+            (codec == "opus" or (codec in ("pcm_s16le", "flac") and sample_rate == 16000))
+            and stream.get("channels") == 1
+            and duration < self.SKIP_CLEAN_MAX_SECONDS
+        )
+    
+    def _parse_result(self, result, return_timestamps: bool) -> Transcription:
+        """Convert an API transcription response into a Transcription."""
+        if return_timestamps:
+            full_text = result.text.strip() if getattr(result, "text", None) else ""
+            segs = getattr(result, "segments", None) or []
+            
+            # Segments are either all dicts or all objects; pick the getter once
+            get = itemgetter("start", "end", "text") if segs and isinstance(segs[0], dict) else attrgetter("start", "end", "text")
+            segments = [
+                TranscriptionSegment(start, end, (text or "").strip())
+                for start, end, text in map(get, segs)
+            ]
+            
+            return Transcription(text=full_text, language=self.language, segments=segments)
+        
+        # Simple text response
+        if isinstance(result, str):
+            text_out = result.strip()
+        else:
+            text_out = (getattr(result, "text", "") or "").strip()
+        
+        return Transcription(text=text_out, language=self.language, segments=[])
+    
+    def _cache_key(
+        self,
+        audio_bytes: bytes,
+        *,
+        model: str,
+        prompt: Optional[str],
+        temperature: Optional[float],
+        return_timestamps: bool,
+    ) -> str:
+        """Build a cache key from the audio bytes and every request parameter."""
+        audio_hash = hashlib.sha256(audio_bytes)
+        params = json.dumps(
+            [model, self.language, prompt, temperature, return_timestamps],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(f"{audio_hash.hexdigest()}|{params}".encode("utf-8")).hexdigest()
+    
+    def _source_cache_key(self, audio_path: StrPath) -> str:
+        """Cache key from the unprocessed audio file plus every setting that shapes the upload."""
+        file_hash = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            while block := f.read(1 << 20):
+                file_hash.update(block)
+        params = json.dumps(
+            [
+                "source", self.model, self.language, self.prompt, self.temperature,
+                self.clean_audio, self.trim_silence, self.upload_format, self.use_vad,
+                self.speed,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(f"{file_hash.hexdigest()}|{params}".encode("utf-8")).hexdigest()
+    
+    def is_silent(self, audio_path: StrPath) -> bool:
+        """Whether a file is effectively silent (mean volume below SILENT_MEAN_VOLUME_DB)."""
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        volume = extractor.mean_volume(audio_path)
+        return volume is not None and volume < self.SILENT_MEAN_VOLUME_DB
+    
+    def cached_transcription(self, audio_path: StrPath) -> Optional[Transcription]:
+        """
+        Look up a transcript of this exact audio file made with the current settings.
+        
+        Unlike the cache inside transcribe (keyed on the cleaned upload), this
+        is keyed on the file as given, so a hit skips the FFmpeg cleanup too.
+        
+        Returns:
+            The cached Transcription, or None (also when caching is disabled)
+        """
+        if not self.use_cache:
+            return None
+        return self._cache_get(self._source_cache_key(audio_path))
+    
+    def cache_transcription(self, audio_path: StrPath, transcription: Transcription) -> None:
+        """Store a transcript for cached_transcription to find (no-op when caching is disabled)."""
+        if self.use_cache:
+            self._cache_put(self._source_cache_key(audio_path), transcription)
+    
+    def _cache_get(self, key: str) -> Optional[Transcription]:
+        """Look up a transcript in memory, then on disk."""
+        with self._cache_lock:
+            cached = self._memory_cache.get(key)
+            if cached is not None:
+                self._memory_cache.move_to_end(key)
+                return cached
+        
+        try:
+            data = self._disk_cache.get(key)
+            if data is None:
+                return self._legacy_cache_get(key)
+            cached = Transcription.from_dict(json.loads(data))
+        except (sqlite3.Error, OSError, ValueError, KeyError):
+            return None
+        
+        self._remember(key, cached)
+        return cached
+    
+    def _legacy_cache_get(self, key: str) -> Optional[Transcription]:
+        """Read a transcript from the older one-JSON-file-per-key cache, moving it into the index."""
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = Transcription.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        self._cache_put(key, cached)
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+        return cached
+    
+    def _cache_put(self, key: str, transcription: Transcription) -> None:
+        """Store a transcript in memory and in the on-disk index."""
+        self._remember(key, transcription)
+        try:
+            self._disk_cache.put(key, json.dumps(transcription.to_dict(), ensure_ascii=False))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: could not write transcript cache: {e}")
+    
+    def _remember(self, key: str, transcription: Transcription) -> None:
+        """Add a transcript to the in-process LRU."""
+        with self._cache_lock:
+            self._memory_cache[key] = transcription
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def prepare_upload(
+        self,
+        audio_path: StrPath,
+        work_dir: StrPath,
+        *,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+    ) -> str:
+        """
+        Run the FFmpeg cleanup pass on its own, ahead of transcription.
+        
+        Lets callers clean one file while another is uploading; pass the
+        result to transcribe/transcribe_large with prepared=True.
+        
+        Args:
+            audio_path: Path to the audio file
+            work_dir: Directory the cleaned file is written to
+            clean_audio: Optional override cleanup (FFmpeg) for this call
+            trim_silence: Optional override trimming for this call
+            
+        Returns:
+            Path of the cleaned file, or audio_path itself when no cleanup
+            is needed (disabled, or a short clip already in upload shape)
+        """
+        audio_path = os.fspath(audio_path)
+        do_clean = clean_audio if clean_audio is not None else self.clean_audio
+        do_trim = trim_silence if trim_silence is not None else self.trim_silence
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        do_clean, do_trim = self._cleanup_plan(extractor, audio_path, do_clean, do_trim)
+        if not (do_clean or do_trim or self.speed != 1.0):
+            return audio_path
+        
+        return extractor.clean_audio_file(
+            audio_path,
+            os.path.join(work_dir, f"clean.{self.upload_format}"),
+            clean_audio=do_clean,
+            trim_silence=do_trim,
+            output_format=self.upload_format,
+            speed=self.speed,
+        )
+    
+    def prepare_upload_bytes(
+        self,
+        audio_path: StrPath,
+        *,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+    ) -> Optional[bytes]:
+        """
+        Like prepare_upload, but FFmpeg's output is piped into memory instead
+        of written to disk; pass it to transcribe_bytes.
+        
+        Args:
+            audio_path: Path to the audio file
+            clean_audio: Optional override cleanup (FFmpeg) for this call
+            trim_silence: Optional override trimming for this call
+            
+        Returns:
+            The cleaned audio, or None when no cleanup is needed and
+            audio_path should be uploaded as-is
+        """
+        audio_path = os.fspath(audio_path)
+        do_clean = clean_audio if clean_audio is not None else self.clean_audio
+        do_trim = trim_silence if trim_silence is not None else self.trim_silence
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        do_clean, do_trim = self._cleanup_plan(extractor, audio_path, do_clean, do_trim)
+        if not (do_clean or do_trim or self.speed != 1.0):
+            return None
+        
+        return extractor.clean_audio_to_bytes(
+            audio_path,
+            clean_audio=do_clean,
+            trim_silence=do_trim,
+            output_format=self.upload_format,
+            speed=self.speed,
+        )
+    
+    def transcribe_large(
+        self,
+        audio_path: StrPath,
+        return_timestamps: bool = True,
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        clean_audio: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+        prepared: bool = False,
+    ) -> Transcription:
+        """
+        Transcribe an audio file of any size.
+        
+        Files that fit the API size limit (after cleanup) are sent as-is.
+        Larger files are split into CHUNK_SECONDS chunks overlapping by
+        CHUNK_OVERLAP_SECONDS, which are transcribed concurrently (at most
+        `max_concurrent` at a time) and stitched back together on the original
+        timeline, each overlap transcribed once.
+        With `use_vad`, non-speech audio is cut out first and segment
+        timestamps are mapped back to the uncut audio. With `speed`, the audio
+        is sped up before upload and timestamps are scaled back.
+        
+        Args:
+            audio_path: Path to the audio file
+            return_timestamps: Whether to include segment timestamps
+            model: Optional override model for this call
+            prompt: Optional override prompt for this call
+            temperature: Optional override temperature for this call
+            clean_audio: Optional override cleanup (FFmpeg) for this call
+            trim_silence: Optional override trimming for this call
+            prepared: The audio was already filtered (and sped up) during extraction
+            
+        Returns:
+            Transcription object with text and optional segments
+        """
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        do_clean = clean_audio if clean_audio is not None else self.clean_audio
+        do_trim = trim_silence if trim_silence is not None else self.trim_silence
+        do_speed = self.speed != 1.0 and not prepared
+        if prepared:
+            do_clean = do_trim = False
+        
+        call_kwargs = dict(
+            return_timestamps=return_timestamps,
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+        )
+        
+        work_dir = tempfile.mkdtemp(prefix="transcribe_")
+        try:
+            # Clean the whole file once, before splitting, so trimming never
+            # shifts chunk boundaries
+            source_path = audio_path
+            extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+            do_clean, do_trim = self._cleanup_plan(
+                extractor, audio_path, do_clean, do_trim, skip_ready=False
+            )
+            if do_clean or do_trim or do_speed:
+                clean_kwargs = dict(
+                    clean_audio=do_clean,
+                    trim_silence=do_trim,
+                    output_format=self.upload_format,
+                    speed=self.speed,
+                )
+                if self.use_vad:
+                    source_path = extractor.clean_audio_file(
+                        audio_path,
+                        os.path.join(work_dir, f"clean.{self.upload_format}"),
+                        **clean_kwargs,
+                    )
+                else:
+                    # Pipe the cleaned audio straight into the upload; it only
+                    # goes to disk when it has to be split
+                    audio_bytes = extractor.clean_audio_to_bytes(audio_path, **clean_kwargs)
+                    if len(audio_bytes) <= self.MAX_FILE_SIZE:
+                        stem = os.path.splitext(os.path.basename(audio_path))[0]
+                        return self.transcribe_bytes(
+                            audio_bytes, f"{stem}.{self.upload_format}", **call_kwargs
+                        )
+                    source_path = os.path.join(work_dir, f"clean.{self.upload_format}")
+                    with open(source_path, "wb") as f:
+                        f.write(audio_bytes)
+                    del audio_bytes
+            
+            intervals = None
+            if self.use_vad:
+                source_path, intervals = self._drop_silence(source_path, work_dir)
+            
+            call_kwargs["prepared"] = True
+            
+            if os.path.getsize(source_path) <= self.MAX_FILE_SIZE:
+                transcription = self.transcribe(source_path, **call_kwargs)
+            else:
+                extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+                chunks = extractor.split_audio(
+                    source_path,
+                    work_dir,
+                    self.CHUNK_SECONDS,
+                    overlap_seconds=self.CHUNK_OVERLAP_SECONDS,
+                )
+                print(f"  Split into {len(chunks)} chunk(s) of up to {self.CHUNK_SECONDS}s")
+                
+                # Segment timestamps are needed to stitch the overlaps
+                results = asyncio.run(
+                    self._transcribe_parallel(chunks, {**call_kwargs, "return_timestamps": True})
+                )
+                transcription = self._stitch_chunks(chunks, results)
+                if not return_timestamps:
+                    transcription = Transcription(
+                        text=transcription.text, language=transcription.language, segments=[]
+                    )
+            
+            if intervals:
+                to_original = VADFilter.to_original_time
+                transcription = Transcription(
+                    text=transcription.text,
+                    language=transcription.language,
+                    segments=[
+                        TranscriptionSegment(
+                            start=to_original(seg.start, intervals),
+                            end=to_original(seg.end, intervals),
+                            text=seg.text,
+                        )
+                        for seg in transcription.segments
+                    ],
+                )
+            return self._rescaled(transcription, self.speed)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def transcribe_batch(
+        self,
+        audio_paths: list[StrPath],
+        *,
+        model: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> list[Transcription]:
+        """
+        Transcribe several short clips with a single API request.
+        
+        The clips are joined with BATCH_GAP_SECONDS of silence between them
+        and uploaded once. Each returned segment is assigned to the clip its
+        midpoint falls in, with timestamps relative to that clip. The clips
+        are used as-is; run prepare_upload on them first for cleanup. If the
+        response has text but no segments to split it by, the clips are
+        transcribed one by one instead.
+        
+        Args:
+            audio_paths: Paths to the audio clips, together well under the
+                API size limit
+            model: Optional override model for this call
+            prompt: Optional override prompt for this call
+            temperature: Optional override temperature for this call
+            
+        Returns:
+            One Transcription per clip, in input order
+        """
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        work_dir = tempfile.mkdtemp(prefix="transcribe_batch_")
+        try:
+            joined_path = os.path.join(work_dir, f"batch.{self.upload_format}")
+            offsets = extractor.concat_audio(
+                audio_paths,
+                joined_path,
+                gap_seconds=self.BATCH_GAP_SECONDS,
+                output_format=self.upload_format,
+            )
+            combined = self.transcribe(
+                joined_path,
+                return_timestamps=True,
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                prepared=True,
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        
+        if combined.text.strip() and not combined.segments:
+            print("  Warning: batched transcript has no segments; transcribing clips separately")
+            return [
+                self.transcribe_large(
+                    path,
+                    return_timestamps=True,
+                    model=model,
+                    prompt=prompt,
+                    temperature=temperature,
+                    prepared=True,
+                )
+                for path in audio_paths
+            ]
+        
+        clip_segments: list[list[TranscriptionSegment]] = [[] for _ in audio_paths]
+        for seg in combined.segments:
+            k = max(0, bisect.bisect_right(offsets, (seg.start + seg.end) / 2) - 1)
+            offset = offsets[k]
+            clip_segments[k].append(
+                TranscriptionSegment(
+                    start=max(0.0, seg.start - offset) * self.speed,
+                    end=max(0.0, seg.end - offset) * self.speed,
+                    text=seg.text,
+                )
+            )
+        
+        return [
+            Transcription(
+                text=" ".join(seg.text.strip() for seg in segments if seg.text.strip()),
+                language=combined.language,
+                segments=segments,
+            )
+            for segments in clip_segments
+        ]
+    
+    def _drop_silence(
+        self,
+        audio_path: str,
+        work_dir: str,
+    ) -> tuple[str, Optional[list[tuple[float, float]]]]:
+        """
+        Cut non-speech audio out of a file using voice activity detection.
+        
+        Returns:
+            (path to upload, kept intervals) - the intervals are None when
+            nothing was cut and the original path is returned
+        """
+        extractor = self.audio_extractor or AudioExtractor(sample_rate=16000)
+        pcm = extractor.decode_pcm(audio_path)
+        total_seconds = len(pcm) / 2 / extractor.sample_rate
+        intervals = VADFilter().speech_intervals(pcm, extractor.sample_rate)
+        
+        voiced_seconds = sum(end - start for start, end in intervals)
+        if not intervals or voiced_seconds >= total_seconds * 0.95:
+            # No speech found (let the API decide) or too little to gain
+            return audio_path, None
+        
+        print(f"  VAD: keeping {voiced_seconds:.0f}s of {total_seconds:.0f}s")
+        voiced_path = extractor.keep_intervals(
+            audio_path,
+            intervals,
+            os.path.join(work_dir, f"voiced.{self.upload_format}"),
+            output_format=self.upload_format,
+        )
+        return voiced_path, intervals
+    
+    async def _transcribe_chunk(
+        self,
+        semaphore: asyncio.Semaphore,
+        chunk_path: str,
+        call_kwargs: dict,
+    ) -> Transcription:
+        """Transcribe one chunk in a worker thread, bounded by the semaphore."""
+        async with semaphore:
+            return await asyncio.to_thread(self.transcribe, chunk_path, **call_kwargs)
+    
+    def _stitch_chunks(
+        self,
+        chunks: list[tuple[str, float]],
+        results: list[Transcription],
+    ) -> Transcription:
+        """
+        Join the transcripts of overlapping chunks into one on the original timeline.
+        
+        Each overlap is cut at its middle. The later chunk keeps every segment
+        ending after the cut, including the one straddling it, and the earlier
+        chunk keeps its segments starting before the first of those. A segment
+        longer than the overlap therefore comes whole from the later chunk
+        instead of being dropped by both sides; at worst the two chunks repeat
+        a few words around the cut.
+        """
+        half_overlap = self.CHUNK_OVERLAP_SECONDS / 2
+        placed = [
+            [(seg.start + offset, seg.end + offset, seg.text) for seg in result.segments]
+            for (_, offset), result in zip(chunks, results)
+        ]
+        
+        # cuts[k] splits chunk k from chunk k + 1; resume[k] is where chunk k + 1 takes over
+        cuts = [offset + half_overlap for _, offset in chunks[1:]]
+        resume = []
+        for k, cut in enumerate(cuts):
+            starts = [start for start, end, _ in placed[k + 1] if end > cut]
+            resume.append(min(starts, default=cut))
+        
+        segments: list[TranscriptionSegment] = []
+        texts: list[str] = []
+        for k, result in enumerate(results):
+            if not result.segments:
+                # Nothing to align on; keep the chunk's text as-is
+                if result.text:
+                    texts.append(result.text)
+                continue
+            
+            after = cuts[k - 1] if k > 0 else float("-inf")
+            before = resume[k] if k < len(cuts) else float("inf")
+            for start, end, text in placed[k]:
+                if end > after and start < before:
+                    segments.append(TranscriptionSegment(start=start, end=end, text=text))
+                    if text:
+                        texts.append(text)
+        
+        return Transcription(text=" ".join(texts), language=self.language, segments=segments)
+    
+    async def _transcribe_parallel(
+        self,
+        chunks: list[tuple[str, float]],
+        call_kwargs: dict,
+    ) -> list[Transcription]:
+        """Transcribe chunks concurrently, returning results in chunk order."""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        return await asyncio.gather(
+            *(self._transcribe_chunk(semaphore, path, call_kwargs) for path, _ in chunks)
+        )
+    
+    def transcribe_video(
+        self,
+        video_path: StrPath,
+        audio_extractor: Optional[AudioExtractor] = None,
+        return_timestamps: bool = True,
+        keep_audio: bool = False,
+    ) -> Transcription:
+        """
+        Transcribe audio from a video file.
         
         Args:
             video_path: Path to the video file
@@ -455,18 +1968,157 @@ class OpenAITranscriber:
         if audio_extractor is None:
             audio_extractor = AudioExtractor()
         
-        # Extract audio to temporary file
-        audio_path = audio_extractor.extract_audio(video_path)
+        # Extract audio to temporary file, applying cleanup filters in the
+        # same FFmpeg pass instead of a second decode/encode round trip
+        audio_path = audio_extractor.extract_audio(
+            video_path,
+            clean_audio=self.clean_audio,
+            trim_silence=self.trim_silence,
+            output_format=self.upload_format,
+            speed=self.speed,
+        )
         
         try:
             # Transcribe the audio
-            result = self.transcribe(audio_path, return_timestamps=return_timestamps)
+            result = self.transcribe_large(
+                audio_path,
+                return_timestamps=return_timestamps,
+                prepared=True,
+            )
         finally:
             # Clean up temporary audio file
             if not keep_audio and os.path.exists(audio_path):
                 os.remove(audio_path)
         
         return result
+    
+    def transcribe_videos(
+        self,
+        video_paths: list[StrPath],
+        audio_extractor: Optional[AudioExtractor] = None,
+        return_timestamps: bool = True,
+        extract_workers: int = 2,
+        transcribe_workers: Optional[int] = None,
+    ) -> list[Transcription | BaseException]:
+        """
+        Extract and transcribe many videos with overlapping thread-pool stages.
+        
+        Extract workers feed a bounded queue that transcribe workers drain,
+        so FFmpeg (CPU) and API uploads (network) run at the same time. The
+        queue bound keeps extraction from racing far ahead of transcription.
+        
+        Args:
+            video_paths: Paths to the video files
+            audio_extractor: AudioExtractor instance (creates one if not provided)
+            return_timestamps: Whether to include segment timestamps
+            extract_workers: Number of concurrent FFmpeg extractions
+            transcribe_workers: Number of concurrent transcriptions (default: max_concurrent)
+            
+        Returns:
+            One Transcription per video in input order, or the exception
+            raised while processing that video
+        """
+        if audio_extractor is None:
+            audio_extractor = AudioExtractor()
+        transcribe_workers = transcribe_workers or self.max_concurrent
+        
+        results: list[Transcription | BaseException | None] = [None] * len(video_paths)
+        ready: queue.Queue = queue.Queue(maxsize=transcribe_workers * 2)
+        
+        def _extract(index: int, video_path: str) -> None:
+            try:
+                audio_path = audio_extractor.extract_audio(
+                    video_path,
+                    clean_audio=self.clean_audio,
+                    trim_silence=self.trim_silence,
+                    output_format=self.upload_format,
+                    speed=self.speed,
+                )
+            except Exception as e:
+                results[index] = e
+                return
+            ready.put((index, audio_path))
+        
+        def _transcribe() -> None:
+            while (item := ready.get()) is not None:
+                index, audio_path = item
+                try:
+                    results[index] = self.transcribe_large(
+                        audio_path,
+                        return_timestamps=return_timestamps,
+                        prepared=True,
+                    )
+                except Exception as e:
+                    results[index] = e
+                finally:
+                    if os.path.exists(audio_path):
+                        os.remove(audio_path)
+        
+        with ThreadPoolExecutor(max_workers=transcribe_workers) as transcribe_pool:
+            for _ in range(transcribe_workers):
+                transcribe_pool.submit(_transcribe)
+            with ThreadPoolExecutor(max_workers=extract_workers) as extract_pool:
+                for index, video_path in enumerate(video_paths):
+                    extract_pool.submit(_extract, index, video_path)
+            # All extractions are done; tell each transcribe worker to stop
+            for _ in range(transcribe_workers):
+                ready.put(None)
+        
+        return results
+    
+    async def transcribe_videos_batch(
+        self,
+        video_paths: list[StrPath],
+        audio_extractor: Optional[AudioExtractor] = None,
+        return_timestamps: bool = True,
+    ) -> list[Transcription | BaseException]:
+        """
+        Extract and transcribe many videos, overlapping FFmpeg with API calls.
+        
+        FFmpeg extractions are bounded by the CPU count and API calls by
+        `max_concurrent`, so extraction of one video proceeds while another
+        is being transcribed.
+        
+        Args:
+            video_paths: Paths to the video files
+            audio_extractor: AudioExtractor instance (creates one if not provided)
+            return_timestamps: Whether to include segment timestamps
+            
+        Returns:
+            One Transcription per video in input order, or the exception
+            raised while processing that video
+        """
+        if audio_extractor is None:
+            audio_extractor = AudioExtractor()
+        
+        ffmpeg_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        api_semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def _process(video_path: str) -> Transcription:
+            async with ffmpeg_semaphore:
+                audio_path = await audio_extractor.extract_audio_async(
+                    video_path,
+                    clean_audio=self.clean_audio,
+                    trim_silence=self.trim_silence,
+                    output_format=self.upload_format,
+                    speed=self.speed,
+                )
+            try:
+                async with api_semaphore:
+                    return await asyncio.to_thread(
+                        self.transcribe_large,
+                        audio_path,
+                        return_timestamps=return_timestamps,
+                        prepared=True,
+                    )
+            finally:
+                if os.path.exists(audio_path):
+                    os.remove(audio_path)
+        
+        return await asyncio.gather(
+            *(_process(p) for p in video_paths),
+            return_exceptions=True,
+        )
 
 
 # Backwards compatibility alias
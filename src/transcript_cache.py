@@ -0,0 +1,88 @@
+"""On-disk transcript cache: a small SQLite key-value store with LRU eviction."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class TranscriptCache:
+    """
+    Map cache keys to serialized transcripts in `<cache_dir>/index.db`.
+    
+    One database file replaces a JSON file per transcript, so lookups are a
+    single indexed query and the cache can be trimmed to the `max_entries`
+    least recently used transcripts. Safe to share between threads; SQLite
+    serializes writers from several processes.
+    """
+    
+    DB_NAME = "index.db"
+    
+    def __init__(self, cache_dir: Path, max_entries: Optional[int] = None):
+        """
+        Initialize the cache (the database is opened on first use).
+        
+        Args:
+            cache_dir: Directory holding the database
+            max_entries: Keep at most this many transcripts (None = unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open (and create if needed) the database; call with the lock held."""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.cache_dir / self.DB_NAME,
+                timeout=30,
+                check_same_thread=False,
+                isolation_level=None,  # autocommit; each statement is atomic
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts ("
+                "key TEXT PRIMARY KEY, data TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS transcripts_last_used ON transcripts (last_used)")
+            self._conn = conn
+        return self._conn
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored data for `key` (marking it recently used), or None."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT data FROM transcripts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE transcripts SET last_used = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+    
+    def put(self, key: str, data: str) -> None:
+        """Store data under `key`, evicting the least recently used entries past max_entries."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts (key, data, last_used) VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            if self.max_entries is not None:
+                (count,) = conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()
+                if count > self.max_entries:
+                    # Walks the last_used index from the oldest end only
+                    conn.execute(
+                        "DELETE FROM transcripts WHERE key IN "
+                        "(SELECT key FROM transcripts ORDER BY last_used LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+    
+    def close(self) -> None:
+        """Close the database connection (it reopens on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,14 +1,42 @@
 """Twitter API v2 client using Tweepy."""
 
+import asyncio
+import functools
 import os
+import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Generator
 from pathlib import Path
-
-import tweepy
-from dotenv import load_dotenv
+from urllib.parse import urlsplit
 
 from .models import Tweet, Thread
+from .rate_limit import RateLimitPacer
+
+
+# Matches a Twitter/X profile URL and captures the username
+PROFILE_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.|mobile\.)?(?:x|twitter)\.com/(?P<username>[A-Za-z0-9_]+)/?"
+)
+
+
+# Numeric path segments after a named one (user/tweet IDs, not the /2 version)
+_PATH_ID_RE = re.compile(r"(?<=[A-Za-z])/\d+(?=/|$)")
+
+
+def _endpoint_key(url: str) -> str:
+    """Reduce a request URL to its endpoint, e.g. /2/users/:id/tweets."""
+    return _PATH_ID_RE.sub("/:id", urlsplit(url).path)
+
+
+@functools.lru_cache(maxsize=128)
+def _iso_utc(value: datetime | str | None) -> Optional[str]:
+    """ISO 8601 form of a datetime (naive means UTC); strings pass through as-is."""
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
 
 
 class TwitterAPIError(Exception):
@@ -16,9 +44,82 @@ class TwitterAPIError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class _Credentials:
+    """Twitter API credentials read from the environment."""
+    
+    api_key: Optional[str]
+    api_secret: Optional[str]
+    access_token: Optional[str]
+    access_token_secret: Optional[str]
+    bearer_token: Optional[str]
+
+
+@functools.cache
+def _env_credentials() -> _Credentials:
+    """Load .env and read the credentials once per process."""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return _Credentials(
+        api_key=os.getenv("TWITTER_API_KEY"),
+        api_secret=os.getenv("TWITTER_API_SECRET"),
+        access_token=os.getenv("TWITTER_ACCESS_TOKEN"),
+        access_token_secret=os.getenv("TWITTER_ACCESS_TOKEN_SECRET"),
+        bearer_token=os.getenv("TWITTER_BEARER_TOKEN"),
+    )
+
+
 class TwitterAPI:
     """Twitter API v2 client for fetching user tweets."""
     
+    # Request fields, pre-joined: Tweepy passes strings through as-is
+    # instead of re-joining a list on every request
+    
+    # Tweet fields to fetch
+    _TWEET_FIELDS = ",".join((
+        "id",
+        "text",
+        "created_at",
+        "author_id",
+        "conversation_id",
+        "in_reply_to_user_id",
+        "referenced_tweets",
+        "attachments",
+        "public_metrics",
+    ))
+    
+    # Media fields for video info
+    _MEDIA_FIELDS = ",".join((
+        "type",
+        "url",
+        "preview_image_url",
+        "variants",
+        "duration_ms",
+    ))
+    
+    # Expansions to include media
+    _EXPANSIONS = ",".join((
+        "attachments.media_keys",
+        "referenced_tweets.id",
+        "author_id",
+    ))
+    
+    _USER_FIELDS = ",".join(("username", "name"))
+    
+    # Conversation (thread) searches need fewer fields
+    _CONVERSATION_TWEET_FIELDS = ",".join((
+        "id", "text", "created_at", "author_id",
+        "conversation_id", "in_reply_to_user_id",
+        "referenced_tweets", "attachments",
+    ))
+    _CONVERSATION_MEDIA_FIELDS = ",".join(("type", "url", "variants"))
+    _CONVERSATION_EXPANSIONS = "attachments.media_keys"
+    
+    # Minimum seconds between timeline pages (the per-user request cap)
+    PAGE_INTERVAL = 1.0
+    _TIMELINE_ENDPOINT = "/2/users/:id/tweets"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -40,13 +141,13 @@ class TwitterAPI:
             bearer_token: App bearer token
         """
         # Load from environment if not provided
-        load_dotenv()
+        env = _env_credentials()
         
-        self.api_key = api_key or os.getenv("TWITTER_API_KEY")
-        self.api_secret = api_secret or os.getenv("TWITTER_API_SECRET")
-        self.access_token = access_token or os.getenv("TWITTER_ACCESS_TOKEN")
-        self.access_token_secret = access_token_secret or os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-        self.bearer_token = bearer_token or os.getenv("TWITTER_BEARER_TOKEN")
+        self.api_key = api_key or env.api_key
+        self.api_secret = api_secret or env.api_secret
+        self.access_token = access_token or env.access_token
+        self.access_token_secret = access_token_secret or env.access_token_secret
+        self.bearer_token = bearer_token or env.bearer_token
         
         # Validate credentials
         if not self.bearer_token:
@@ -55,6 +156,12 @@ class TwitterAPI:
                 "Please set it in your .env file or pass it directly."
             )
         
+        # Tweepy (and requests under it) is imported here rather than at
+        # module level so importing this module stays cheap
+        import tweepy
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         # Initialize Tweepy client
         self.client = tweepy.Client(
             bearer_token=self.bearer_token,
@@ -64,6 +171,35 @@ class TwitterAPI:
             access_token_secret=self.access_token_secret,
             wait_on_rate_limit=True,  # Automatically wait when rate limited
         )
+        
+        # Tweepy keeps one requests.Session; give it a larger keep-alive pool
+        # and retry transient gateway errors at the connection level
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET"],
+                # Hand the last 5xx back to tweepy, which raises TwitterServerError
+                raise_on_status=False,
+            ),
+        )
+        self.client.session.mount("https://", adapter)
+        
+        # wait_on_rate_limit only reacts to a 429 by sleeping out the whole
+        # window; watch the rate-limit headers to pace pages ahead of that
+        self._pacer = RateLimitPacer(self.PAGE_INTERVAL)
+        self.client.session.hooks["response"].append(self._record_rate_limit)
+        
+        # username (lowercase) -> user ID; saves a users/by/username call
+        # (and its rate-limit budget) on repeated lookups
+        self._user_id_cache: dict[str, str] = {}
+    
+    def _record_rate_limit(self, response, *args, **kwargs) -> None:
+        """requests response hook: feed rate-limit headers to the pacer."""
+        self._pacer.update(_endpoint_key(response.url), response.headers)
     
     def get_user_id(self, username: str) -> str:
         """
@@ -78,11 +214,19 @@ class TwitterAPI:
         # Remove @ if present
         username = username.lstrip("@")
         
+        cached = self._user_id_cache.get(username.lower())
+        if cached is not None:
+            return cached
+        
+        import tweepy
+        
         try:
             user = self.client.get_user(username=username)
             if user.data is None:
                 raise TwitterAPIError(f"User not found: {username}")
-            return str(user.data.id)
+            user_id = str(user.data.id)
+            self._user_id_cache[username.lower()] = user_id
+            return user_id
         except tweepy.errors.NotFound:
             raise TwitterAPIError(f"User not found: {username}")
         except tweepy.errors.TweepyException as e:
@@ -91,115 +235,115 @@ class TwitterAPI:
     def get_user_tweets(
         self,
         username: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: datetime | str | None = None,
+        end_date: datetime | str | None = None,
         max_results: int = 100,
         limit: Optional[int] = None,
+        since_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
     ) -> Generator[dict, None, None]:
         """
         Fetch tweets from a user's timeline.
         
         Args:
             username: Twitter username
-            start_date: Only fetch tweets after this date
-            end_date: Only fetch tweets before this date
+            start_date: Only fetch tweets after this date (datetime, or an
+                ISO 8601 string passed through unchanged)
+            end_date: Only fetch tweets before this date (same forms)
             max_results: Results per API request (max 100)
             limit: Maximum total tweets to fetch (None = no limit)
+            since_id: Only fetch tweets newer than this tweet ID; pagination
+                stops as soon as it is reached (None = no lower bound)
+            max_pages: Maximum number of pages to request (None = no limit)
             
         Yields:
             Tweet data dictionaries
         """
         user_id = self.get_user_id(username)
+        request_kwargs = self._timeline_request(
+            user_id,
+            start_date=start_date,
+            end_date=end_date,
+            since_id=since_id,
+            max_results=max_results,
+        )
         
-        # Convert dates to UTC if provided
-        start_time = None
-        end_time = None
-        
-        if start_date:
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-            start_time = start_date.isoformat()
-        
-        if end_date:
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
-            end_time = end_date.isoformat()
-        
-        # Tweet fields to fetch
-        tweet_fields = [
-            "id",
-            "text",
-            "created_at",
-            "author_id",
-            "conversation_id",
-            "in_reply_to_user_id",
-            "referenced_tweets",
-            "attachments",
-            "public_metrics",
-        ]
-        
-        # Media fields for video info
-        media_fields = [
-            "type",
-            "url",
-            "preview_image_url",
-            "variants",
-            "duration_ms",
-        ]
-        
-        # Expansions to include media
-        expansions = [
-            "attachments.media_keys",
-            "referenced_tweets.id",
-            "author_id",
-        ]
-        
-        user_fields = ["username", "name"]
+        import tweepy
         
         tweet_count = 0
-        pagination_token = None
+        since_id_int = int(since_id) if since_id else None
+        url_prefix = "https://x.com/" + username + "/status/"
         
-        while True:
-            try:
-                response = self.client.get_users_tweets(
-                    id=user_id,
-                    start_time=start_time,
-                    end_time=end_time,
-                    max_results=min(max_results, 100),
-                    tweet_fields=tweet_fields,
-                    media_fields=media_fields,
-                    expansions=expansions,
-                    user_fields=user_fields,
-                    pagination_token=pagination_token,
-                )
-            except tweepy.errors.TweepyException as e:
-                raise TwitterAPIError(f"Error fetching tweets: {e}")
-            
-            if response.data is None:
-                break
-            
-            # Build media lookup from includes
-            media_lookup = {}
-            if response.includes and "media" in response.includes:
-                for media in response.includes["media"]:
-                    media_lookup[media.media_key] = media
-            
-            # Process each tweet
-            for tweet in response.data:
-                tweet_data = self._parse_tweet(tweet, media_lookup, username)
-                yield tweet_data
+        # Paginator follows next_token for us; iterate whole pages (rather
+        # than flatten()) because each page carries its own media includes
+        pages = tweepy.Paginator(
+            self.client.get_users_tweets,
+            **request_kwargs,
+            limit=max_pages or float("inf"),
+        )
+        
+        try:
+            for response in pages:
+                if response.data is None:
+                    break
                 
-                tweet_count += 1
-                if limit and tweet_count >= limit:
-                    return
-            
-            # Check for more pages
-            if response.meta and "next_token" in response.meta:
-                pagination_token = response.meta["next_token"]
-            else:
-                break
+                media_lookup = self._media_lookup(response)
+                
+                # Process each tweet
+                for tweet in response.data:
+                    # Reached tweets we already have: nothing older is needed
+                    if since_id_int is not None and tweet.id <= since_id_int:
+                        return
+                    
+                    tweet_data = self._parse_tweet(tweet, media_lookup, username, url_prefix)
+                    yield tweet_data
+                    
+                    tweet_count += 1
+                    if limit and tweet_count >= limit:
+                        return
+                
+                if response.meta.get("next_token"):
+                    self._pacer.wait(self._TIMELINE_ENDPOINT)
+        except tweepy.errors.TweepyException as e:
+            raise TwitterAPIError(f"Error fetching tweets: {e}")
+    
+    @classmethod
+    def _timeline_request(
+        cls,
+        user_id: str,
+        *,
+        start_date: datetime | str | None,
+        end_date: datetime | str | None,
+        since_id: Optional[str],
+        max_results: int,
+    ) -> dict:
+        """Build the get_users_tweets arguments shared by every page request."""
+        return {
+            "id": user_id,
+            "start_time": _iso_utc(start_date),
+            "end_time": _iso_utc(end_date),
+            "since_id": since_id,
+            "max_results": min(max_results, 100),
+            "tweet_fields": cls._TWEET_FIELDS,
+            "media_fields": cls._MEDIA_FIELDS,
+            "expansions": cls._EXPANSIONS,
+            "user_fields": cls._USER_FIELDS,
+        }
+    
+    @staticmethod
+    def _media_lookup(response) -> dict:
+        """Build a media_key -> media object lookup from a response's includes."""
+        if not response.includes:
+            return {}
+        return {media.media_key: media for media in response.includes.get("media") or ()}
     
-    def _parse_tweet(self, tweet, media_lookup: dict, username: str) -> dict:
+    def _parse_tweet(
+        self,
+        tweet,
+        media_lookup: dict,
+        username: str,
+        url_prefix: Optional[str] = None,
+    ) -> dict:
         """
         Parse a tweet response into a dictionary.
         
@@ -207,33 +351,37 @@ class TwitterAPI:
             tweet: Tweepy tweet object
             media_lookup: Dictionary of media_key -> media object
             username: The username we're fetching from
+            url_prefix: "https://x.com/<username>/status/", built once by
+                callers parsing many tweets of the same user
             
         Returns:
             Parsed tweet dictionary
         """
+        if url_prefix is None:
+            url_prefix = "https://x.com/" + username + "/status/"
+        tweet_id = str(tweet.id)
+        
         # Get video URL if present
         video_url = None
         has_video = False
         
-        if hasattr(tweet, "attachments") and tweet.attachments:
+        # Text-only tweets (or pages without media) skip the lookup entirely
+        if media_lookup and getattr(tweet, "attachments", None):
             media_keys = tweet.attachments.get("media_keys", [])
             for media_key in media_keys:
                 media = media_lookup.get(media_key)
                 if media and media.type == "video":
                     has_video = True
-                    # Get the best quality video variant
+                    # Get the best quality (highest bitrate) MP4 variant in one pass
                     if hasattr(media, "variants") and media.variants:
-                        video_variants = [
-                            v for v in media.variants
-                            if v.get("content_type") == "video/mp4"
-                        ]
-                        if video_variants:
-                            # Sort by bitrate (highest first)
-                            video_variants.sort(
-                                key=lambda v: v.get("bit_rate", 0),
-                                reverse=True
-                            )
-                            video_url = video_variants[0].get("url")
+                        best_bit_rate = -1
+                        for variant in media.variants:
+                            if variant.get("content_type") != "video/mp4":
+                                continue
+                            bit_rate = variant.get("bit_rate") or 0
+                            if bit_rate > best_bit_rate:
+                                best_bit_rate = bit_rate
+                                video_url = variant.get("url")
                     break
         
         # Check if it's a reply
@@ -249,11 +397,11 @@ class TwitterAPI:
                     is_retweet = True
         
         return {
-            "id": str(tweet.id),
+            "id": tweet_id,
             "author": username,
             "text": tweet.text,
             "datetime": tweet.created_at.isoformat() if tweet.created_at else None,
-            "url": f"https://x.com/{username}/status/{tweet.id}",
+            "url": url_prefix + tweet_id,
             "hasVideo": has_video,
             "videoUrl": video_url,
             "isRetweet": is_retweet,
@@ -277,47 +425,258 @@ class TwitterAPI:
         Returns:
             List of tweet dictionaries in the conversation
         """
+        import tweepy
+        
         try:
-            # Search for tweets in this conversation
-            query = f"conversation_id:{conversation_id} from:{author_username}"
-            
-            tweet_fields = [
-                "id", "text", "created_at", "author_id",
-                "conversation_id", "in_reply_to_user_id",
-                "referenced_tweets", "attachments",
-            ]
-            media_fields = ["type", "url", "variants"]
-            expansions = ["attachments.media_keys"]
-            
             response = self.client.search_recent_tweets(
-                query=query,
-                tweet_fields=tweet_fields,
-                media_fields=media_fields,
-                expansions=expansions,
-                max_results=100,
+                **self._conversation_request(conversation_id, author_username)
             )
+            return self._parse_conversation(response, author_username)
+            
+        except tweepy.errors.TweepyException as e:
+            print(f"Warning: Could not fetch conversation {conversation_id}: {e}")
+            return []
+    
+    @classmethod
+    def _conversation_request(cls, conversation_id: str, author_username: str) -> dict:
+        """Build the search_recent_tweets arguments for one conversation."""
+        # Search for tweets in this conversation
+        query = f"conversation_id:{conversation_id} from:{author_username}"
+        
+        return {
+            "query": query,
+            "tweet_fields": cls._CONVERSATION_TWEET_FIELDS,
+            "media_fields": cls._CONVERSATION_MEDIA_FIELDS,
+            "expansions": cls._CONVERSATION_EXPANSIONS,
+            "max_results": 100,
+        }
+    
+    def _parse_conversation(self, response, author_username: str) -> list[dict]:
+        """Parse a conversation search response into date-sorted tweet dicts."""
+        if response.data is None:
+            return []
+        
+        media_lookup = self._media_lookup(response)
+        url_prefix = "https://x.com/" + author_username + "/status/"
+        
+        tweets = []
+        for tweet in response.data:
+            tweet_data = self._parse_tweet(tweet, media_lookup, author_username, url_prefix)
+            tweets.append(tweet_data)
+        
+        # Sort by date
+        tweets.sort(key=lambda t: t.get("datetime", ""))
+        
+        return tweets
+    
+    # -------------------------------------------------------------------------
+    # Async fetching (tweepy.asynchronous, needs the optional aiohttp package)
+    # -------------------------------------------------------------------------
+    
+    def _create_async_client(self):
+        """Create a Tweepy AsyncClient with the same credentials as `client`."""
+        try:
+            from tweepy.asynchronous import AsyncClient
+        except ImportError as e:
+            raise TwitterAPIError(
+                "Async fetching needs aiohttp. Install it with: pip install \"tweepy[async]\""
+            ) from e
+        
+        return AsyncClient(
+            bearer_token=self.bearer_token,
+            consumer_key=self.api_key,
+            consumer_secret=self.api_secret,
+            access_token=self.access_token,
+            access_token_secret=self.access_token_secret,
+            wait_on_rate_limit=True,
+        )
+    
+    async def get_user_tweets_async(
+        self,
+        username: str,
+        start_date: datetime | str | None = None,
+        end_date: datetime | str | None = None,
+        max_results: int = 100,
+        limit: Optional[int] = None,
+        since_id: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        *,
+        client=None,
+    ) -> list[dict]:
+        """
+        Async version of get_user_tweets, returning the collected tweets.
+        
+        Pages of one timeline still depend on each other's pagination token;
+        the gain comes from fetching several users at once (see
+        get_users_tweets_async).
+        
+        Args:
+            username: Twitter username
+            start_date: Only fetch tweets after this date (datetime, or an
+                ISO 8601 string passed through unchanged)
+            end_date: Only fetch tweets before this date (same forms)
+            max_results: Results per API request (max 100)
+            limit: Maximum total tweets to fetch (None = no limit)
+            since_id: Only fetch tweets newer than this tweet ID
+            max_pages: Maximum number of pages to request (None = no limit)
+            client: AsyncClient to use (creates one if not provided)
+            
+        Returns:
+            List of tweet data dictionaries, newest first
+        """
+        import tweepy
+        
+        client = client or self._create_async_client()
+        username = username.lstrip("@")
+        
+        user_id = self._user_id_cache.get(username.lower())
+        if user_id is None:
+            try:
+                user = await client.get_user(username=username)
+            except tweepy.errors.NotFound:
+                raise TwitterAPIError(f"User not found: {username}")
+            except tweepy.errors.TweepyException as e:
+                raise TwitterAPIError(f"Error fetching user: {e}")
+            if user.data is None:
+                raise TwitterAPIError(f"User not found: {username}")
+            user_id = str(user.data.id)
+            self._user_id_cache[username.lower()] = user_id
+        
+        request_kwargs = self._timeline_request(
+            user_id,
+            start_date=start_date,
+            end_date=end_date,
+            since_id=since_id,
+            max_results=max_results,
+        )
+        since_id_int = int(since_id) if since_id else None
+        url_prefix = "https://x.com/" + username + "/status/"
+        
+        tweets: list[dict] = []
+        page_count = 0
+        pagination_token = None
+        
+        while True:
+            try:
+                response = await client.get_users_tweets(
+                    **request_kwargs,
+                    pagination_token=pagination_token,
+                )
+            except tweepy.errors.TweepyException as e:
+                raise TwitterAPIError(f"Error fetching tweets: {e}")
+            
+            page_count += 1
             
             if response.data is None:
-                return []
+                break
             
-            media_lookup = {}
-            if response.includes and "media" in response.includes:
-                for media in response.includes["media"]:
-                    media_lookup[media.media_key] = media
+            media_lookup = self._media_lookup(response)
             
-            tweets = []
             for tweet in response.data:
-                tweet_data = self._parse_tweet(tweet, media_lookup, author_username)
-                tweets.append(tweet_data)
+                if since_id_int is not None and tweet.id <= since_id_int:
+                    return tweets
+                
+                tweets.append(self._parse_tweet(tweet, media_lookup, username, url_prefix))
+                if limit and len(tweets) >= limit:
+                    return tweets
             
-            # Sort by date
-            tweets.sort(key=lambda t: t.get("datetime", ""))
+            if max_pages and page_count >= max_pages:
+                break
             
-            return tweets
+            if response.meta and "next_token" in response.meta:
+                pagination_token = response.meta["next_token"]
+            else:
+                break
+        
+        return tweets
+    
+    async def get_users_tweets_async(
+        self,
+        usernames: list[str],
+        concurrency: int = 8,
+        **kwargs,
+    ) -> dict[str, list[dict] | TwitterAPIError]:
+        """
+        Fetch several users' timelines concurrently.
+        
+        Args:
+            usernames: Twitter usernames
+            concurrency: Maximum timelines fetched at once
+            **kwargs: Passed to get_user_tweets_async (dates, limit, ...)
             
-        except tweepy.errors.TweepyException as e:
-            print(f"Warning: Could not fetch conversation {conversation_id}: {e}")
-            return []
+        Returns:
+            Mapping of username -> tweet dictionaries, or the TwitterAPIError
+            raised while fetching that user
+        """
+        client = self._create_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _fetch(username: str) -> list[dict] | TwitterAPIError:
+            async with semaphore:
+                try:
+                    return await self.get_user_tweets_async(username, client=client, **kwargs)
+                except TwitterAPIError as e:
+                    return e
+        
+        results = await asyncio.gather(*(_fetch(u) for u in usernames))
+        return dict(zip(usernames, results))
+    
+    async def get_conversations_tweets_async(
+        self,
+        conversation_ids: list[str],
+        author_username: str,
+        concurrency: int = 8,
+    ) -> dict[str, list[dict]]:
+        """
+        Fetch several conversations (threads) by the same author concurrently.
+        
+        Args:
+            conversation_ids: Conversation IDs to fetch
+            author_username: Filter to only this author's tweets
+            concurrency: Maximum searches in flight at once
+            
+        Returns:
+            Mapping of conversation_id -> date-sorted tweet dictionaries
+            (empty when a conversation could not be fetched)
+        """
+        import tweepy
+        
+        client = self._create_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _fetch(conversation_id: str) -> list[dict]:
+            async with semaphore:
+                try:
+                    response = await client.search_recent_tweets(
+                        **self._conversation_request(conversation_id, author_username)
+                    )
+                except tweepy.errors.TweepyException as e:
+                    print(f"Warning: Could not fetch conversation {conversation_id}: {e}")
+                    return []
+            return self._parse_conversation(response, author_username)
+        
+        results = await asyncio.gather(*(_fetch(c) for c in conversation_ids))
+        return dict(zip(conversation_ids, results))
+    
+    def get_users_tweets(
+        self,
+        usernames: list[str],
+        concurrency: int = 8,
+        **kwargs,
+    ) -> dict[str, list[dict] | TwitterAPIError]:
+        """Blocking wrapper around get_users_tweets_async."""
+        return asyncio.run(self.get_users_tweets_async(usernames, concurrency, **kwargs))
+    
+    def get_conversations_tweets(
+        self,
+        conversation_ids: list[str],
+        author_username: str,
+        concurrency: int = 8,
+    ) -> dict[str, list[dict]]:
+        """Blocking wrapper around get_conversations_tweets_async."""
+        return asyncio.run(
+            self.get_conversations_tweets_async(conversation_ids, author_username, concurrency)
+        )
 
 
 def create_twitter_api(
@@ -339,10 +698,7 @@ def create_twitter_api(
 
 def extract_username_from_url(url: str) -> str:
     """Extract username from a Twitter/X URL."""
-    url = url.rstrip("/")
-    # Handle both x.com and twitter.com URLs
-    parts = url.split("/")
-    for i, part in enumerate(parts):
-        if part in ("x.com", "twitter.com") and i + 1 < len(parts):
-            return parts[i + 1]
-    raise ValueError(f"Could not extract username from URL: {url}")
+    match = PROFILE_URL_RE.match(url.strip())
+    if match is None:
+        raise ValueError(f"Could not extract username from URL: {url}")
+    return match.group("username")
@@ -0,0 +1,97 @@
+"""Voice activity detection, using webrtcvad when it is installed."""
+
+try:
+    import webrtcvad
+except ImportError:  # webrtcvad is optional; VAD is skipped without it
+    webrtcvad = None
+
+
+class VADFilter:
+    """Find voiced regions in 16-bit mono PCM audio."""
+    
+    # Sample rates and frame lengths accepted by WebRTC VAD
+    SAMPLE_RATES = (8000, 16000, 32000, 48000)
+    FRAME_MS = (10, 20, 30)
+    
+    def __init__(
+        self,
+        aggressiveness: int = 2,
+        frame_ms: int = 30,
+        padding: float = 0.2,
+        min_silence: float = 0.5,
+    ):
+        """
+        Initialize the VAD filter.
+        
+        Args:
+            aggressiveness: WebRTC VAD mode, 0 (least) to 3 (most aggressive)
+            frame_ms: Analysis frame length in milliseconds (10, 20 or 30)
+            padding: Seconds of audio kept on each side of a voiced region
+            min_silence: Gaps shorter than this (seconds) are kept, so pauses
+                between words are never cut
+        """
+        if webrtcvad is None:
+            raise RuntimeError("webrtcvad is not installed. Install it with: pip install webrtcvad")
+        if frame_ms not in self.FRAME_MS:
+            raise ValueError(f"frame_ms must be one of {self.FRAME_MS}, got {frame_ms}")
+        
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self.frame_ms = frame_ms
+        self.padding = padding
+        self.min_silence = min_silence
+    
+    @staticmethod
+    def available() -> bool:
+        """Whether the optional webrtcvad dependency is installed."""
+        return webrtcvad is not None
+    
+    def speech_intervals(self, pcm: bytes, sample_rate: int = 16000) -> list[tuple[float, float]]:
+        """
+        Locate voiced regions in raw PCM audio.
+        
+        Args:
+            pcm: Raw signed 16-bit little-endian mono samples
+            sample_rate: Sample rate of `pcm` in Hz
+        
+        Returns:
+            Sorted, non-overlapping (start, end) intervals in seconds
+        """
+        if sample_rate not in self.SAMPLE_RATES:
+            raise ValueError(f"sample_rate must be one of {self.SAMPLE_RATES}, got {sample_rate}")
+        
+        frame_bytes = sample_rate * self.frame_ms // 1000 * 2
+        frame_seconds = self.frame_ms / 1000
+        total_seconds = len(pcm) / 2 / sample_rate
+        
+        intervals: list[tuple[float, float]] = []
+        for i, offset in enumerate(range(0, len(pcm) - frame_bytes + 1, frame_bytes)):
+            if not self._vad.is_speech(pcm[offset:offset + frame_bytes], sample_rate):
+                continue
+            start = max(0.0, i * frame_seconds - self.padding)
+            end = min(total_seconds, (i + 1) * frame_seconds + self.padding)
+            if intervals and start - intervals[-1][1] < self.min_silence:
+                intervals[-1] = (intervals[-1][0], end)
+            else:
+                intervals.append((start, end))
+        
+        return intervals
+    
+    @staticmethod
+    def to_original_time(t: float, intervals: list[tuple[float, float]]) -> float:
+        """
+        Map a time in the voiced-only audio back to the original timeline.
+        
+        Args:
+            t: Seconds into the audio made of `intervals` joined back to back
+            intervals: The kept (start, end) intervals of the original audio
+        
+        Returns:
+            The matching time in the original audio
+        """
+        elapsed = 0.0
+        for start, end in intervals:
+            length = end - start
+            if t <= elapsed + length:
+                return start + (t - elapsed)
+            elapsed += length
+        return intervals[-1][1] if intervals else t
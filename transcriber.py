@@ -11,24 +11,102 @@ Two-phase workflow:
 """
 
 import argparse
-import json
+import asyncio
+import contextlib
+import os
+import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+from src import jsonio
 from src.transcriber import AudioExtractor, OpenAITranscriber, Transcription
 
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm is optional; without it progress is only printed per file
+    tqdm = None
+
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# Default number of audio files transcribed at once
+DEFAULT_CONCURRENCY = 8
+
+# Default cap on transcription requests per minute (0 = no cap)
+DEFAULT_RPM = 50
+
+# Default number of videos extracted at once
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# Most videos handled by one FFmpeg process during extraction
+EXTRACT_GROUP_SIZE = 8
+
+# Splits a media stem like 2024_01_15_1234567890_voice into prefix and kind
+_SUFFIX_RE = re.compile(r"^(?P<prefix>.+?)_(?P<kind>video|voice)$")
+
+
 def get_prefix_from_filename(filename: str, suffix: str) -> str | None:
-    """Extract the prefix (date_id) from a filename with given suffix."""
-    if filename.endswith(suffix):
-        return filename[:-len(suffix)]
+    """Extract the prefix (date_id) from a filename with given suffix (_video or _voice)."""
+    match = _SUFFIX_RE.match(filename)
+    if match and match["kind"] == suffix.lstrip("_"):
+        return match["prefix"]
     return None
 
 
+def strip_media_suffix(stem: str) -> str:
+    """Strip a trailing _video/_voice from a file stem, if present."""
+    match = _SUFFIX_RE.match(stem)
+    return match["prefix"] if match else stem
+
+
+def _scan_files(directory: Path, match) -> list[Path]:
+    """List regular files in a directory whose name satisfies `match`, in one scandir pass."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if match(entry.name) and entry.is_file()
+        )
+
+
+class _BarSafeStdout:
+    """stdout stand-in that prints above the progress bar instead of through it."""
+    
+    def write(self, text: str) -> None:
+        # print() writes the trailing newline separately; tqdm.write adds its own
+        if text.rstrip():
+            tqdm.write(text, file=sys.__stdout__)
+    
+    def flush(self) -> None:
+        sys.__stdout__.flush()
+
+
+@contextlib.contextmanager
+def _progress(total: int, desc: str):
+    """
+    Show an overall progress bar with ETA while the block runs.
+    
+    Yields a callback advancing the bar by n files. Without tqdm, or when
+    stderr is not a terminal, the callback does nothing.
+    """
+    if tqdm is None or total == 0:
+        yield lambda n=1: None
+        return
+    
+    with tqdm(total=total, desc=desc, unit="file", disable=None) as bar:
+        if bar.disable:
+            yield bar.update
+            return
+        with contextlib.redirect_stdout(_BarSafeStdout()):
+            yield bar.update
+
+
 def find_video_files(path: Path) -> list[Path]:
     """Find all video files in a path (file or directory)."""
     video_extensions = {".mp4", ".mkv", ".webm", ".mov", ".avi"}
@@ -41,10 +119,7 @@ def find_video_files(path: Path) -> list[Path]:
             return []
     
     if path.is_dir():
-        videos = []
-        for ext in video_extensions:
-            videos.extend(path.glob(f"*{ext}"))
-        return sorted(videos)
+        return _scan_files(path, lambda name: os.path.splitext(name)[1] in video_extensions)
     
     return []
 
@@ -61,16 +136,11 @@ def find_audio_files(path: Path) -> list[Path]:
             return []
     
     if path.is_dir():
-        # Look for *_voice.wav files specifically
-        voice_files = list(path.glob("*_voice.wav"))
-        if voice_files:
-            return sorted(voice_files)
+        audio_files = _scan_files(path, lambda name: os.path.splitext(name)[1] in audio_extensions)
         
-        # Fall back to all audio files
-        audio_files = []
-        for ext in audio_extensions:
-            audio_files.extend(path.glob(f"*{ext}"))
-        return sorted(audio_files)
+        # Prefer *_voice.wav files specifically, else all audio files
+        voice_files = [p for p in audio_files if p.name.endswith("_voice.wav")]
+        return voice_files or audio_files
     
     return []
 
@@ -99,15 +169,42 @@ def find_corresponding_json(file_path: Path, file_suffix: str) -> Path | None:
     return None
 
 
-def update_json_with_transcript(json_path: Path, transcription: Transcription) -> None:
-    """Update a JSON file with transcription data."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def _build_json_index(directory: Path) -> dict[str, Path]:
+    """
+    Map each prefix (date_id) to its tweet JSON in a directory, in one scandir pass.
     
-    data["transcript"] = transcription.to_dict()
+    Same preference as find_corresponding_json: a *_twitt.json wins over a
+    *_thread_twitt.json with the same prefix.
+    """
+    index: dict[str, Path] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith("_thread_twitt.json"):
+                index.setdefault(name[:-len("_thread_twitt.json")], Path(entry.path))
+            elif name.endswith("_twitt.json"):
+                index[name[:-len("_twitt.json")]] = Path(entry.path)
+    return index
+
+
+def update_json_with_transcript(
+    json_path: Path,
+    transcription: Transcription,
+    data: dict | None = None,
+) -> None:
+    """
+    Update a JSON file with transcription data.
+    
+    Args:
+        json_path: Tweet/thread JSON file to update
+        transcription: Transcription to store under "transcript"
+        data: Already-parsed contents of json_path (read from disk if None)
+    """
+    if data is None:
+        data = jsonio.loads(json_path.read_bytes())
     
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    data["transcript"] = transcription.to_dict()
+    jsonio.dump_atomic(data, json_path)
 
 
 # =============================================================================
@@ -120,6 +217,8 @@ def extract_audio_from_videos(
     skip_existing: bool = True,
     clean_audio: bool = False,
     trim_silence: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    keep_hifi: bool = False,
 ) -> None:
     """
     Extract audio from video files and save as voice files.
@@ -130,6 +229,8 @@ def extract_audio_from_videos(
         skip_existing: Skip videos that already have extracted audio
         clean_audio: Apply denoise + normalization filters during extraction
         trim_silence: Trim leading/trailing silence (conservative thresholds)
+        jobs: Maximum number of videos extracted at once
+        keep_hifi: Keep the source sample rate and channels instead of 16 kHz mono
     """
     # Find video files
     video_files = find_video_files(input_path)
@@ -141,49 +242,99 @@ def extract_audio_from_videos(
     print(f"Found {len(video_files)} video file(s)")
     
     # Initialize audio extractor
-    audio_extractor = AudioExtractor()
+    audio_extractor = AudioExtractor(keep_hifi=keep_hifi)
     
-    # Process each video
-    successful = 0
+    total = len(video_files)
     skipped = 0
-    failed = 0
     
+    # Index existing voice files once (one scandir per directory) instead of
+    # a stat per video
+    existing_voices: set[Path] = set()
+    if skip_existing:
+        voice_dirs = {output_dir} if output_dir else {p.parent for p in video_files}
+        for voice_dir in voice_dirs:
+            if voice_dir.is_dir():
+                existing_voices.update(
+                    _scan_files(voice_dir, lambda name: name.endswith("_voice.wav"))
+                )
+    
+    # Determine output paths and drop already-extracted videos up front, so
+    # only real work is handed to the workers
+    pending: list[tuple[int, Path, Path]] = []
     for i, video_path in enumerate(video_files, 1):
-        print(f"\n[{i}/{len(video_files)}] Processing: {video_path.name}")
-        
-        # Determine output path
-        video_name = video_path.stem
-        if video_name.endswith("_video"):
-            prefix = video_name[:-6]  # Remove "_video" suffix
-            voice_name = f"{prefix}_voice.wav"
-        else:
-            voice_name = f"{video_name}_voice.wav"
+        voice_name = f"{strip_media_suffix(video_path.stem)}_voice.wav"
         
         out_dir = output_dir if output_dir else video_path.parent
-        out_dir.mkdir(parents=True, exist_ok=True)
         voice_path = out_dir / voice_name
         
         # Check if already extracted
-        if skip_existing and voice_path.exists():
-            print(f"  Skipping (voice file exists)")
+        if skip_existing and voice_path in existing_voices:
+            print(f"[{i}/{total}] {video_path.name}: Skipping (voice file exists)")
             skipped += 1
             continue
         
+        out_dir.mkdir(parents=True, exist_ok=True)
+        pending.append((i, video_path, voice_path))
+    
+    def _extract(job: tuple[int, Path, Path]) -> bool:
+        """Extract one video's audio; returns whether it succeeded."""
+        i, video_path, voice_path = job
+        tag = f"[{i}/{total}] {video_path.name}"
+        
         try:
-            # Extract audio
-            print(f"  Extracting audio...")
+            print(f"{tag}: Extracting audio...")
             audio_extractor.extract_audio(
                 str(video_path),
                 str(voice_path),
                 clean_audio=clean_audio,
                 trim_silence=trim_silence,
             )
-            print(f"  Saved: {voice_name}")
-            successful += 1
+            print(f"{tag}: Saved: {voice_path.name}")
+            return True
             
         except Exception as e:
-            print(f"  Error: {e}")
-            failed += 1
+            print(f"{tag}: Error: {e}")
+            return False
+    
+    def _extract_group(group: list[tuple[int, Path, Path]]) -> list[bool]:
+        """Extract a group of videos with one FFmpeg process; returns per-video success."""
+        if len(group) == 1:
+            return [_extract(group[0])]
+        
+        try:
+            for i, video_path, _ in group:
+                print(f"[{i}/{total}] {video_path.name}: Extracting audio...")
+            audio_extractor.extract_audio_many(
+                [(video_path, voice_path) for _, video_path, voice_path in group],
+                clean_audio=clean_audio,
+                trim_silence=trim_silence,
+            )
+        except Exception:
+            # One bad input fails the whole command; redo the group one by
+            # one so the good videos still get extracted
+            return [_extract(job) for job in group]
+        
+        for i, video_path, voice_path in group:
+            print(f"[{i}/{total}] {video_path.name}: Saved: {voice_path.name}")
+        return [True] * len(group)
+    
+    # Videos are grouped so one FFmpeg process handles several (saving a
+    # process start per video), but into at least `jobs` groups so every
+    # worker has something to do. The workers only wait on FFmpeg, so
+    # threads are enough to keep every core busy.
+    group_size = max(1, min(EXTRACT_GROUP_SIZE, -(-len(pending) // jobs)))
+    groups = [pending[k:k + group_size] for k in range(0, len(pending), group_size)]
+    
+    if pending:
+        print(f"Extracting up to {jobs} group(s) of {group_size} file(s) at a time\n")
+    results: list[bool] = []
+    with _progress(len(pending), "Extracting") as advance, ThreadPoolExecutor(max_workers=jobs) as executor:
+        for group_results in executor.map(_extract_group, groups):
+            results.extend(group_results)
+            advance(len(group_results))
+    
+    successful = sum(results)
+    failed = len(results) - successful
     
     # Summary
     print(f"\n{'='*50}")
@@ -201,23 +352,35 @@ def save_subtitle(
     audio_path: Path,
     transcription: Transcription,
     output_dir: Path,
+    compact: bool = False,
 ) -> Path:
-    """Save transcription to a subtitle JSON file."""
+    """
+    Save transcription to a subtitle JSON file.
+    
+    With `compact`, the JSON has no indentation and segments are streamed to
+    the file one at a time instead of serializing the whole document in memory.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Create subtitle filename from audio filename
     # voice: 2024_01_15_1234567890_voice.wav -> subtitle: 2024_01_15_1234567890_subtitle.json
-    audio_name = audio_path.stem
-    if audio_name.endswith("_voice"):
-        prefix = audio_name[:-6]  # Remove "_voice" suffix
-        subtitle_name = f"{prefix}_subtitle.json"
-    else:
-        subtitle_name = f"{audio_name}_subtitle.json"
+    subtitle_name = f"{strip_media_suffix(audio_path.stem)}_subtitle.json"
     
     output_path = output_dir / subtitle_name
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(transcription.to_dict(), ensure_ascii=False, indent=2, fp=f)
+    with open(output_path, "wb") as f:
+        if not compact:
+            f.write(jsonio.dumps(transcription.to_dict()))
+        else:
+            # Same keys as Transcription.to_dict()
+            f.write(b'{"text":' + jsonio.dumps(transcription.text, compact=True))
+            f.write(b',"language":' + jsonio.dumps(transcription.language, compact=True))
+            f.write(b',"segments":[')
+            for i, segment in enumerate(transcription.segments):
+                if i:
+                    f.write(b",")
+                f.write(jsonio.dumps(segment.to_dict(), compact=True))
+            f.write(b"]}")
     
     return output_path
 
@@ -232,6 +395,15 @@ def transcribe_audio_files(
     temperature: float | None = None,
     clean_audio: bool = True,
     trim_silence: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    compact: bool = False,
+    rpm: float = DEFAULT_RPM,
+    batch_seconds: float = 0,
+    cache_dir: Path | None = None,
+    use_cache: bool | None = None,
+    speed: float | None = None,
+    upload_format: str | None = None,
+    local_options: dict | None = None,
 ) -> None:
     """
     Transcribe audio files to subtitles using OpenAI Whisper API.
@@ -246,6 +418,17 @@ def transcribe_audio_files(
         temperature: Optional decoding temperature
         clean_audio: Apply FFmpeg cleanup before upload (denoise + normalize)
         trim_silence: Trim leading/trailing silence before upload
+        concurrency: Maximum number of files transcribed at once
+        compact: Write subtitle files without indentation (streamed per segment)
+        rpm: Maximum transcription requests started per minute (0 = no cap)
+        batch_seconds: Send consecutive clips shorter than this together in one
+            request, up to this combined length (0 = one request per file)
+        cache_dir: Transcript cache directory (default: env/transcriber default)
+        use_cache: Reuse cached transcripts of identical audio (default: env, on)
+        speed: Speed audio up by this factor before transcription (default: env, 1.0)
+        upload_format: Format cleaned audio is uploaded in: ogg, flac or wav (default: env, ogg)
+        local_options: Transcribe locally with faster-whisper, passing these
+            to LocalTranscriber (model, device, ...); None uses the OpenAI API
     """
     # Find audio files
     audio_files = find_audio_files(input_path)
@@ -258,84 +441,292 @@ def transcribe_audio_files(
     print(f"Found {len(audio_files)} audio file(s)")
     
     # Initialize transcriber
-    print("\nInitializing OpenAI Whisper transcriber...")
-    transcriber = OpenAITranscriber(
-        model=model,
+    transcriber_options = dict(
         prompt=prompt,
         temperature=temperature,
         clean_audio=clean_audio,
         trim_silence=trim_silence,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+        speed=speed,
+        upload_format=upload_format,
     )
+    if local_options is not None:
+        from src.local_transcriber import LocalTranscriber
+        
+        print("\nLoading local faster-whisper model...")
+        transcriber = LocalTranscriber(**local_options, **transcriber_options)
+    else:
+        print("\nInitializing OpenAI Whisper transcriber...")
+        transcriber = OpenAITranscriber(
+            model=model,
+            requests_per_minute=rpm,
+            **transcriber_options,
+        )
     
-    # Process each audio file
-    successful = 0
-    skipped = 0
-    failed = 0
+    total = len(audio_files)
+    
+    # Index existing subtitles once (one scandir per directory) instead of
+    # a stat per audio file
+    existing_subtitles: set[Path] = set()
+    if skip_existing and not update_json:
+        subtitle_dirs = {output_dir} if output_dir else {p.parent for p in audio_files}
+        for subtitle_dir in subtitle_dirs:
+            if subtitle_dir.is_dir():
+                existing_subtitles.update(
+                    _scan_files(subtitle_dir, lambda name: name.endswith("_subtitle.json"))
+                )
+    
+    # Likewise index the tweet JSONs next to the audio files up front
+    json_indexes: dict[Path, dict[str, Path]] = {}
+    if update_json:
+        json_indexes = {d: _build_json_index(d) for d in {p.parent for p in audio_files}}
     
-    for i, audio_path in enumerate(audio_files, 1):
-        print(f"\n[{i}/{len(audio_files)}] Processing: {audio_path.name}")
+    def _lookup(tag: str, audio_path: Path) -> tuple[Path | None, bytes | None] | None:
+        """Find the tweet JSON for an audio file; returns None if the file is skipped."""
+        # Resolve (and read) the tweet JSON once; it serves both the
+        # skip check and the update after transcription
+        json_path = None
+        if update_json:
+            prefix = get_prefix_from_filename(audio_path.stem, "_voice")
+            json_path = json_indexes[audio_path.parent].get(prefix) if prefix else None
+        json_raw = json_path.read_bytes() if json_path else None
         
         # Check if already transcribed
         if skip_existing:
             if update_json:
-                json_path = find_corresponding_json(audio_path, "_voice")
-                if json_path:
-                    with open(json_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    if "transcript" in data:
-                        print(f"  Skipping (already transcribed)")
-                        skipped += 1
-                        continue
+                # Byte scan for the key instead of parsing the whole file
+                if json_raw is not None and b'"transcript":' in json_raw:
+                    print(f"{tag}: Skipping (already transcribed)")
+                    return None
             else:
                 # Check for subtitle file
-                audio_name = audio_path.stem
-                if audio_name.endswith("_voice"):
-                    prefix = audio_name[:-6]
-                    subtitle_name = f"{prefix}_subtitle.json"
-                else:
-                    subtitle_name = f"{audio_name}_subtitle.json"
+                subtitle_name = f"{strip_media_suffix(audio_path.stem)}_subtitle.json"
                 
                 check_dir = output_dir if output_dir else audio_path.parent
-                subtitle_path = check_dir / subtitle_name
-                if subtitle_path.exists():
-                    print(f"  Skipping (subtitle exists)")
-                    skipped += 1
-                    continue
+                if check_dir / subtitle_name in existing_subtitles:
+                    print(f"{tag}: Skipping (subtitle exists)")
+                    return None
         
-        try:
-            # Transcribe audio
-            print(f"  Transcribing...")
-            transcription = transcriber.transcribe(
-                str(audio_path),
-                return_timestamps=True,
-            )
-            
-            # Show preview
-            preview = transcription.text[:100] + "..." if len(transcription.text) > 100 else transcription.text
-            print(f"  Result: {preview}")
-            
-            # Save results
-            if update_json:
-                json_path = find_corresponding_json(audio_path, "_voice")
-                if json_path:
-                    update_json_with_transcript(json_path, transcription)
-                    print(f"  Updated: {json_path.name}")
-                else:
-                    print(f"  Warning: No corresponding JSON found for {audio_path.name}")
-                    # Fall back to saving subtitle file
-                    out_dir = output_dir if output_dir else audio_path.parent
-                    save_path = save_subtitle(audio_path, transcription, out_dir)
-                    print(f"  Saved subtitle: {save_path.name}")
+        return json_path, json_raw
+    
+    def _save(
+        tag: str,
+        audio_path: Path,
+        transcription: Transcription,
+        json_path: Path | None,
+        json_raw: bytes | None,
+    ) -> None:
+        """Store one file's transcription in its tweet JSON or a subtitle file."""
+        # Show preview
+        preview = transcription.text[:100] + "..." if len(transcription.text) > 100 else transcription.text
+        print(f"{tag}: Result: {preview}")
+        
+        # Save results
+        if update_json:
+            if json_path:
+                update_json_with_transcript(json_path, transcription, jsonio.loads(json_raw))
+                print(f"{tag}: Updated: {json_path.name}")
             else:
+                print(f"{tag}: Warning: No corresponding JSON found")
+                # Fall back to saving subtitle file
                 out_dir = output_dir if output_dir else audio_path.parent
-                save_path = save_subtitle(audio_path, transcription, out_dir)
-                print(f"  Saved: {save_path.name}")
-            
-            successful += 1
-            
+                save_path = save_subtitle(audio_path, transcription, out_dir, compact)
+                print(f"{tag}: Saved subtitle: {save_path.name}")
+        else:
+            out_dir = output_dir if output_dir else audio_path.parent
+            save_path = save_subtitle(audio_path, transcription, out_dir, compact)
+            print(f"{tag}: Saved: {save_path.name}")
+    
+    def _transcribe(jobs: list[tuple], upload_paths: list[str | bytes]) -> list[str]:
+        """
+        Transcribe prepared audio files, several short clips in a single request.
+        
+        A single job's upload may be the cleaned audio itself, in memory.
+        Returns "successful" or "failed" per job.
+        """
+        try:
+            if len(jobs) == 1 and isinstance(upload_paths[0], bytes):
+                print(f"{jobs[0][0]}: Transcribing...")
+                upload_name = f"{jobs[0][1].stem}.{transcriber.upload_format}"
+                transcriptions = [transcriber.transcribe_bytes(upload_paths[0], upload_name)]
+            elif len(jobs) == 1:
+                print(f"{jobs[0][0]}: Transcribing...")
+                transcriptions = [
+                    transcriber.transcribe_large(
+                        upload_paths[0],
+                        return_timestamps=True,
+                        prepared=True,
+                    )
+                ]
+            else:
+                for tag, *_ in jobs:
+                    print(f"{tag}: Transcribing (batched with {len(jobs) - 1} other clip(s))...")
+                transcriptions = transcriber.transcribe_batch(upload_paths)
+        except Exception as e:
+            for tag, *_ in jobs:
+                print(f"{tag}: Error: {e}")
+            return ["failed"] * len(jobs)
+        
+        statuses = []
+        for job, transcription in zip(jobs, transcriptions):
+            transcriber.cache_transcription(job[1], transcription)
+            statuses.append(_finish(job, transcription))
+        return statuses
+    
+    def _finish(job: tuple, transcription: Transcription) -> str:
+        """Save a job's transcription; returns "successful" or "failed"."""
+        tag, audio_path, json_path, json_raw = job
+        try:
+            _save(tag, audio_path, transcription, json_path, json_raw)
+            return "successful"
         except Exception as e:
-            print(f"  Error: {e}")
-            failed += 1
+            print(f"{tag}: Error: {e}")
+            return "failed"
+    
+    def _from_cache(job: tuple) -> str | None:
+        """Finish a job from the transcript cache; returns None on a miss."""
+        transcription = transcriber.cached_transcription(job[1])
+        if transcription is not None:
+            print(f"{job[0]}: Using cached transcript")
+            return _finish(job, transcription)
+        return None
+    
+    def _if_silent(job: tuple) -> str | None:
+        """
+        Finish a job with an empty transcript if its audio is silent (one
+        FFmpeg decode); returns None when the file needs transcribing.
+        """
+        if transcriber.is_silent(job[1]):
+            print(f"{job[0]}: Silent audio, saving an empty transcript")
+            return _finish(job, Transcription(text="", language=transcriber.language, segments=[]))
+        
+        return None
+    
+    def _group_short_clips(jobs: list[tuple]) -> list[list[tuple]]:
+        """
+        Group consecutive short clips whose combined length (with the gaps
+        between them) fits in batch_seconds; longer files stay on their own.
+        """
+        extractor = AudioExtractor()
+        gap = transcriber.BATCH_GAP_SECONDS
+        
+        units: list[list[tuple]] = []
+        batch: list[tuple] = []
+        batch_seconds_used = 0.0
+        for job in jobs:
+            duration = extractor.duration(job[1])
+            if duration is None or duration + gap > batch_seconds:
+                units.append([job])
+                continue
+            if batch and batch_seconds_used + duration + gap > batch_seconds:
+                units.append(batch)
+                batch, batch_seconds_used = [], 0.0
+            batch.append(job)
+            batch_seconds_used += duration + gap
+        if batch:
+            units.append(batch)
+        return units
+    
+    def _prepare(unit: list[tuple], work_dir: str) -> list[str | bytes]:
+        """Run FFmpeg cleanup for a unit; returns what _transcribe uploads per job."""
+        if len(unit) == 1 and not transcriber.use_vad:
+            # Pipe the cleaned audio into memory instead of a temp file,
+            # unless it needs splitting (or VAD) on disk
+            audio_bytes = transcriber.prepare_upload_bytes(unit[0][1])
+            if audio_bytes is None:
+                return [str(unit[0][1])]
+            if len(audio_bytes) <= transcriber.MAX_FILE_SIZE:
+                return [audio_bytes]
+            upload_path = os.path.join(work_dir, f"clean.{transcriber.upload_format}")
+            with open(upload_path, "wb") as f:
+                f.write(audio_bytes)
+            return [upload_path]
+        
+        upload_paths = []
+        for k, job in enumerate(unit):
+            clip_dir = os.path.join(work_dir, str(k))
+            os.mkdir(clip_dir)
+            upload_paths.append(transcriber.prepare_upload(job[1], clip_dir))
+        return upload_paths
+    
+    async def _run(advance) -> list[str]:
+        # Two stages with separate limits: FFmpeg cleanup (CPU-bound) and
+        # upload + transcription (network-bound), so later files are being
+        # cleaned while earlier ones upload. `in_flight` keeps cleanup from
+        # running more than a couple of batches ahead of the uploads.
+        ffmpeg_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        api_semaphore = asyncio.Semaphore(concurrency)
+        in_flight = asyncio.Semaphore(concurrency * 2)
+        
+        found = await asyncio.gather(
+            *(
+                asyncio.to_thread(_lookup, f"[{i}/{total}] {audio_path.name}", audio_path)
+                for i, audio_path in enumerate(audio_files, 1)
+            )
+        )
+        jobs = [
+            (f"[{i}/{total}] {audio_path.name}", audio_path, *result)
+            for i, (audio_path, result) in enumerate(zip(audio_files, found), 1)
+            if result is not None
+        ]
+        statuses = ["skipped"] * (total - len(jobs))
+        
+        # Audio transcribed before with the same settings comes straight from
+        # the cache, and silent audio needs no transcript; neither goes
+        # through FFmpeg cleanup or the API
+        async def _shortcut(job: tuple) -> str | None:
+            status = await asyncio.to_thread(_from_cache, job)
+            if status is None:
+                # The silence check decodes the whole file, so it shares the FFmpeg limit
+                async with ffmpeg_semaphore:
+                    status = await asyncio.to_thread(_if_silent, job)
+            return status
+        
+        shortcut_statuses = await asyncio.gather(*(_shortcut(job) for job in jobs))
+        statuses.extend(status for status in shortcut_statuses if status is not None)
+        jobs = [job for job, status in zip(jobs, shortcut_statuses) if status is None]
+        advance(len(statuses))
+        
+        # Each unit is one API request: a single file, or a batch of clips
+        if batch_seconds > 0:
+            units = await asyncio.to_thread(_group_short_clips, jobs)
+        else:
+            units = [[job] for job in jobs]
+        
+        async def _process(unit: list[tuple]) -> list[str]:
+            async with in_flight:
+                with tempfile.TemporaryDirectory(prefix="transcribe_") as work_dir:
+                    try:
+                        async with ffmpeg_semaphore:
+                            upload_paths = await asyncio.to_thread(_prepare, unit, work_dir)
+                    except Exception as e:
+                        for tag, *_ in unit:
+                            print(f"{tag}: Error: {e}")
+                        return ["failed"] * len(unit)
+                    
+                    async with api_semaphore:
+                        return await asyncio.to_thread(_transcribe, unit, upload_paths)
+        
+        async def _tracked(unit: list[tuple]) -> list[str]:
+            unit_statuses = await _process(unit)
+            advance(len(unit))
+            return unit_statuses
+        
+        for unit_statuses in await asyncio.gather(*(_tracked(unit) for unit in units)):
+            statuses.extend(unit_statuses)
+        return statuses
+    
+    print(f"Transcribing up to {concurrency} file(s) at a time\n")
+    try:
+        with _progress(total, "Transcribing") as advance:
+            statuses = asyncio.run(_run(advance))
+    finally:
+        transcriber.close()
+    
+    successful = statuses.count("successful")
+    skipped = statuses.count("skipped")
+    failed = statuses.count("failed")
     
     # Summary
     print(f"\n{'='*50}")
@@ -378,6 +769,14 @@ Optional environment variables:
   OPENAI_TRANSCRIBE_TEMPERATURE - Optional decoding temperature (e.g. 0 or 0.2)
   TRANSCRIBE_CLEAN_AUDIO - 1/true to enable FFmpeg cleanup (default: true)
   TRANSCRIBE_TRIM_SILENCE - 1/true to trim leading/trailing silence (default: true)
+  TRANSCRIBE_UPLOAD_FORMAT - ogg (Opus, ~10x smaller), flac (lossless, ~2x smaller) or wav (default: ogg)
+  TRANSCRIBE_VAD - 1/true to cut non-speech audio before upload; needs webrtcvad (default: false)
+  TRANSCRIBE_SPEED - Speed audio up by this factor before upload, e.g. 1.5 (default: 1.0)
+  OPENAI_TRANSCRIBE_CONCURRENCY - Chunks of a >25MB file transcribed in parallel (default: 5)
+  OPENAI_TRANSCRIBE_RPM - Cap on transcription requests per minute (default 50; overridden by --rpm)
+  TRANSCRIBE_CACHE - 1/true to reuse cached transcripts of identical audio (default: true)
+  TRANSCRIBE_CACHE_DIR - Transcript cache directory (default: ~/.cache/twitterscrapper/transcripts)
+  TRANSCRIBE_CACHE_MAX_ENTRIES - Transcripts kept in the cache, least recently used dropped first (default: 10000; 0 = unlimited)
         """,
     )
     
@@ -423,6 +822,19 @@ Optional environment variables:
         help="Trim leading/trailing silence during extraction (conservative thresholds)",
     )
     
+    extract_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Videos extracted in parallel (default: CPU count, {DEFAULT_JOBS})",
+    )
+    
+    extract_parser.add_argument(
+        "--keep-hifi",
+        action="store_true",
+        help="Keep the source sample rate and channels instead of 16 kHz mono (larger files)",
+    )
+    
     # =========================
     # transcribe subcommand
     # =========================
@@ -508,6 +920,112 @@ Optional environment variables:
         help="Disable silence trimming before upload",
     )
     
+    transcribe_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Audio files transcribed in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    
+    transcribe_parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help=(
+            "Maximum transcription requests per minute, 0 for no cap "
+            f"(default: OPENAI_TRANSCRIBE_RPM, else {DEFAULT_RPM})"
+        ),
+    )
+    
+    transcribe_parser.add_argument(
+        "--batch-seconds",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Transcribe short clips together in one request, up to this combined length (e.g. 25; default: off)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--upload-format",
+        choices=["ogg", "flac", "wav"],
+        default=None,
+        help="Format cleaned audio is uploaded in: ogg (Opus, smallest), flac (lossless) or wav (default: TRANSCRIBE_UPLOAD_FORMAT or ogg)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="Speed audio up by this factor before upload to cut cost and latency; 1.5 is safe for speech (default: TRANSCRIBE_SPEED or 1.0)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Transcript cache directory (default: TRANSCRIBE_CACHE_DIR or ~/.cache/twitterscrapper/transcripts)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=None,
+        help="Always call the API, ignoring cached transcripts of identical audio",
+    )
+    
+    transcribe_parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Transcribe on this machine with faster-whisper instead of the OpenAI API",
+    )
+    
+    transcribe_parser.add_argument(
+        "--local-model",
+        default=None,
+        help="faster-whisper model name or path for --local (default: large-v3)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--device",
+        choices=["auto", "cuda", "cpu"],
+        default="auto",
+        help="Device for --local inference (default: auto)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--compute-type",
+        default="int8",
+        help="CTranslate2 quantization for --local, e.g. int8, int8_float16, float16 (default: int8)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Audio windows decoded together with --local (default: 8)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="CPU threads for --local on the CPU (default: 0, CTranslate2's choice)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=1,
+        help="Files transcribed in parallel on the one loaded --local model (default: 1)",
+    )
+    
+    transcribe_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write subtitle JSON without indentation (smaller, faster for long audio)",
+    )
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -515,6 +1033,40 @@ Optional environment variables:
         parser.print_help()
         sys.exit(1)
     
+    if getattr(args, "concurrency", 1) < 1:
+        print("Error: --concurrency must be at least 1")
+        sys.exit(1)
+    
+    if getattr(args, "jobs", 1) < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+    
+    if hasattr(args, "rpm") and args.rpm is None:
+        # The flag wins; otherwise fall back to the environment (or .env), then the default
+        load_dotenv()
+        raw = os.environ.get("OPENAI_TRANSCRIBE_RPM", "").strip()
+        try:
+            args.rpm = float(raw) if raw else DEFAULT_RPM
+        except ValueError:
+            print(f"Error: OPENAI_TRANSCRIBE_RPM must be a number, got {raw!r}")
+            sys.exit(1)
+    
+    if getattr(args, "rpm", 0) < 0:
+        print("Error: --rpm must not be negative")
+        sys.exit(1)
+    
+    if getattr(args, "batch_seconds", 0) < 0:
+        print("Error: --batch-seconds must not be negative")
+        sys.exit(1)
+    
+    if getattr(args, "local_workers", 1) < 1:
+        print("Error: --local-workers must be at least 1")
+        sys.exit(1)
+    
+    if getattr(args, "speed", None) is not None and args.speed <= 0:
+        print("Error: --speed must be positive")
+        sys.exit(1)
+    
     # Validate input path
     if not args.input.exists():
         print(f"Error: Input path does not exist: {args.input}")
@@ -528,6 +1080,8 @@ Optional environment variables:
             skip_existing=not args.no_skip,
             clean_audio=args.clean_audio,
             trim_silence=args.trim_silence,
+            jobs=args.jobs,
+            keep_hifi=args.keep_hifi,
         )
     elif args.command == "transcribe":
         transcribe_audio_files(
@@ -540,6 +1094,22 @@ Optional environment variables:
             temperature=args.temperature,
             clean_audio=args.clean_audio,
             trim_silence=args.trim_silence,
+            concurrency=args.concurrency,
+            compact=args.compact,
+            rpm=args.rpm,
+            batch_seconds=args.batch_seconds,
+            cache_dir=args.cache_dir,
+            use_cache=args.use_cache,
+            speed=args.speed,
+            upload_format=args.upload_format,
+            local_options=dict(
+                model=args.local_model,
+                device=args.device,
+                compute_type=args.compute_type,
+                batch_size=args.batch_size,
+                cpu_threads=args.cpu_threads,
+                num_workers=args.local_workers,
+            ) if args.local else None,
         )
 
 